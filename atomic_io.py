@@ -0,0 +1,64 @@
+"""
+Atomic File Module
+Temp-file-and-rename helpers shared by the export, sharding, scheduler,
+history and recurring campaign modules, so readers never see a partial file
+
+Permission policy:
+    default              Created as 0666 minus the user's umask, like open()
+    PRIVATE_FILE_MODE    Owner only (local state such as target history)
+    SHARED_FILE_MODE     Readable by other accounts whatever the umask
+                         (campaign shard queues shared between nodes)
+"""
+
+import json
+import os
+import secrets
+
+DEFAULT_FILE_MODE = 0o666
+PRIVATE_FILE_MODE = 0o600
+SHARED_FILE_MODE = 0o644
+
+
+def create_temp(path, prefix='.tmp_', suffix='.tmp', mode=None):
+    """
+    Create a temp file beside `path`
+
+    Unlike tempfile.mkstemp (always 0600) the file is created with `mode`
+    and the kernel applies the umask, so without an explicit mode the
+    result gets the same permissions as a plain open() would give it.
+
+    Returns:
+        tuple: (fd, tmp_path)
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    flags = os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, 'O_BINARY', 0)
+    while True:
+        tmp_path = os.path.join(directory, f"{prefix}{secrets.token_hex(4)}{suffix}")
+        try:
+            return os.open(tmp_path, flags, DEFAULT_FILE_MODE if mode is None else mode), tmp_path
+        except FileExistsError:
+            continue
+
+
+def publish_file(tmp_path, path, mode=None):
+    """
+    Rename a finished temp file over the target
+
+    With `mode` the file is first given exactly that mode, regardless of
+    the umask it was created under.
+    """
+    if mode is not None:
+        os.chmod(tmp_path, mode)
+    os.replace(tmp_path, path)
+
+
+def write_json_atomic(path, data, mode=None, indent=2):
+    """Write JSON through a temp file and rename so readers never see a partial file"""
+    fd, tmp_path = create_temp(path, suffix='.json', mode=mode)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=indent)
+        publish_file(tmp_path, path, mode)
+    except Exception:
+        os.unlink(tmp_path)
+        raise
@@ -0,0 +1,395 @@
+"""
+RECON-OPS GUI Responsiveness Benchmark
+Drives ReconOpsApp under a virtual display (Xvfb) with synthetic catalogs
+and domain lists, and reports event-loop latency, queries_text insert time
+and process memory (RSS) growth as JSON
+
+Nothing traces allocations while operations are timed. Memory is read
+from the process RSS between cycles, which also covers what Tk/Tcl
+allocates for the Text widget and is invisible to tracemalloc.
+
+Usage:
+    python bench_gui.py --templates 5000 --repeats 5 -o bench_results.json
+    python bench_gui.py --baseline bench_baseline.json --threshold 0.25
+
+Exit code is 1 when any metric regressed past the threshold versus the
+baseline, 2 when the benchmark could not run.
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+HEARTBEAT_MS = 5        # Event-loop probe interval
+SETTLE_TIMEOUT_S = 30   # Give up waiting for deferred UI work after this long
+OPERATIONS = ('generate', 'copy', 'export', 'clear')
+
+
+def start_virtual_display(width=1600, height=1200):
+    """
+    Start Xvfb on a free display number when no display is available
+
+    Returns:
+        subprocess.Popen or None: The Xvfb process (None when a display already exists)
+    """
+    if os.environ.get('DISPLAY') or platform.system() == 'Windows':
+        return None
+    if not shutil.which('Xvfb'):
+        raise RuntimeError("No DISPLAY set and Xvfb is not installed")
+
+    for number in range(99, 140):
+        if os.path.exists(f"/tmp/.X11-unix/X{number}") or os.path.exists(f"/tmp/.X{number}-lock"):
+            continue
+        process = subprocess.Popen(['Xvfb', f":{number}", '-screen', '0', f"{width}x{height}x24", '-nolisten', 'tcp'],
+                                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        deadline = time.time() + 10
+        while time.time() < deadline:
+            if os.path.exists(f"/tmp/.X11-unix/X{number}"):
+                os.environ['DISPLAY'] = f":{number}"
+                return process
+            if process.poll() is not None:
+                break
+            time.sleep(0.05)
+        process.kill()
+    raise RuntimeError("Could not start Xvfb")
+
+
+def synthetic_catalog(template_count, categories=40):
+    """Catalog of realistic-looking templates spread over categories"""
+    operators = ('filetype:{ext}', 'inurl:{word}', 'intitle:"{word}"', '"{word}.{ext}"', 'ext:{ext}')
+    extensions = ('pdf', 'sql', 'env', 'log', 'bak', 'xls', 'conf', 'php', 'json', 'yml')
+    words = ('admin', 'backup', 'config', 'secret', 'token', 'dump', 'panel', 'login', 'debug', 'export')
+    catalog = {}
+    for index in range(template_count):
+        terms = []
+        for term in range(3 + index % 5):
+            pattern = operators[(index + term) % len(operators)]
+            terms.append(pattern.format(ext=extensions[(index * 3 + term) % len(extensions)],
+                                        word=f"{words[(index + term * 7) % len(words)]}{index % 97}"))
+        category = f"Synthetic Category {index % categories:02d}"
+        catalog.setdefault(category, []).append(f"site:{{domain}} ({' OR '.join(terms)})")
+    return catalog
+
+
+def synthetic_domains(count):
+    return [f"target{index:04d}.example-{index % 7}.com" for index in range(count)]
+
+
+class EventLoopProbe:
+    """Measure how late a fixed-interval after() callback fires
+
+    While a handler blocks the event loop, the heartbeat cannot run. The
+    lateness of the next beat is therefore the latency a user would feel.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self.samples = []
+        self.running = False
+        self._last = 0.0
+        self._job = None
+
+    def _beat(self):
+        now = time.perf_counter()
+        self.samples.append(max(0.0, (now - self._last) * 1000 - HEARTBEAT_MS))
+        self._last = now
+        if self.running:
+            self._job = self.root.after(HEARTBEAT_MS, self._beat)
+
+    def start(self):
+        self.samples = []
+        self.running = True
+        self._last = time.perf_counter()
+        self._job = self.root.after(HEARTBEAT_MS, self._beat)
+
+    def stop(self):
+        self.running = False
+        if self._job is not None:
+            self.root.after_cancel(self._job)
+            self._job = None
+        return list(self.samples)
+
+
+def process_rss_bytes():
+    """
+    Resident set size of this process, or None where it cannot be read
+
+    /proc/self/statm gives the current RSS on Linux. Elsewhere the peak
+    from getrusage is the closest available figure.
+    """
+    try:
+        with open('/proc/self/statm', 'r') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024  # Bytes on macOS, KiB elsewhere
+
+
+def app_is_busy(app):
+    """True while the app still has UI work of its own queued (time-sliced rendering)
+
+    Unrelated timers such as the debounced history save or the catalog poll
+    are deliberately ignored - waiting on them would measure their delay.
+    """
+    return app.render_job is not None or bool(app.render_queue)
+
+
+def pump_until_settled(root, app, minimum_s=0.05):
+    """Run the event loop until the app's deferred rendering has drained"""
+    start = time.perf_counter()
+    while True:
+        root.update()
+        elapsed = time.perf_counter() - start
+        if elapsed >= minimum_s and not app_is_busy(app):
+            return
+        if elapsed > SETTLE_TIMEOUT_S:
+            return
+        time.sleep(0.001)
+
+
+def flush_side_work(app):
+    """Run the debounced history save now, outside any measured window"""
+    if app.history_save_job is not None:
+        app.root.after_cancel(app.history_save_job)
+        app.flush_target_history(wait=True)
+
+
+def wait_for_search_index(root, app):
+    """Let the startup index build finish so its worker thread does not skew the first cycle"""
+    deadline = time.perf_counter() + SETTLE_TIMEOUT_S
+    while app.search_index is None and time.perf_counter() < deadline:
+        root.update()
+        time.sleep(0.005)
+
+
+def percentile(values, fraction):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+class InsertTimer:
+    """Wrap queries_text.insert to accumulate time spent inserting"""
+
+    def __init__(self, widget):
+        self.widget = widget
+        self.original = widget.insert
+        self.total_ms = 0.0
+        self.calls = 0
+        widget.insert = self
+
+    def __call__(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return self.original(*args, **kwargs)
+        finally:
+            self.total_ms += (time.perf_counter() - start) * 1000
+            self.calls += 1
+
+    def reset(self):
+        self.total_ms = 0.0
+        self.calls = 0
+
+
+def neutralize_dialogs(recon_ops, export_path, clipboard):
+    """Replace modal dialogs and the clipboard backend so the run is unattended"""
+    recon_ops.messagebox.showinfo = lambda *a, **k: 'ok'
+    recon_ops.messagebox.showwarning = lambda *a, **k: 'ok'
+    recon_ops.messagebox.showerror = lambda *a, **k: 'ok'
+    recon_ops.messagebox.askyesno = lambda *a, **k: True
+    recon_ops.messagebox.askyesnocancel = lambda *a, **k: False
+    recon_ops.filedialog.asksaveasfilename = lambda *a, **k: export_path
+    # The system clipboard is not what is being measured (and is absent on Xvfb)
+    recon_ops.pyperclip.copy = lambda text: clipboard.append(len(text))
+
+
+def run_benchmark(args):
+    """Drive the app and collect metrics"""
+    import tkinter as tk
+    import recon_ops
+    from google_dorks import GOOGLE_DORKS
+
+    workdir = tempfile.mkdtemp(prefix='recon_bench_')
+    previous_cwd = os.getcwd()
+    os.chdir(workdir)  # Keep settings/history/export files out of the user's tree
+
+    original_catalog = {category: list(templates) for category, templates in GOOGLE_DORKS.items()}
+    GOOGLE_DORKS.clear()
+    GOOGLE_DORKS.update(synthetic_catalog(args.templates))
+    domains = synthetic_domains(args.domains)
+
+    clipboard = []
+    neutralize_dialogs(recon_ops, os.path.join(workdir, 'export.txt'), clipboard)
+
+    root = tk.Tk()
+    try:
+        app = recon_ops.ReconOpsApp(root)
+        app.select_all_categories()
+        root.update()
+        wait_for_search_index(root, app)
+        insert_timer = InsertTimer(app.queries_text)
+        probe = EventLoopProbe(root)
+
+        actions = {
+            'generate': app.generate_queries,
+            'copy': app.copy_all_queries,
+            'export': app.export_queries,
+            'clear': app.clear_queries,
+        }
+        timings = {name: {'duration_ms': [], 'max_latency_ms': [], 'p95_latency_ms': []} for name in OPERATIONS}
+        insert_ms = []
+        lines_rendered = []
+        memory_after_cycle = []
+
+        for repeat in range(args.repeats):
+            app.target_domain.set(domains[repeat % len(domains)])
+            for name in OPERATIONS:
+                insert_timer.reset()
+                probe.start()
+                pump_until_settled(root, app, minimum_s=0.02)
+
+                start = time.perf_counter()
+                actions[name]()
+                pump_until_settled(root, app, minimum_s=0)
+                duration = (time.perf_counter() - start) * 1000
+                samples = probe.stop()
+                flush_side_work(app)
+
+                timings[name]['duration_ms'].append(duration)
+                timings[name]['max_latency_ms'].append(max(samples, default=0.0))
+                timings[name]['p95_latency_ms'].append(percentile(samples, 0.95))
+                if name == 'generate':
+                    insert_ms.append(insert_timer.total_ms)
+                    lines_rendered.append(int(app.queries_text.index('end-1c').split('.')[0]))
+
+            root.update()
+            rss = process_rss_bytes()
+            if rss is not None:
+                memory_after_cycle.append(rss)
+    finally:
+        root.destroy()
+        GOOGLE_DORKS.clear()
+        GOOGLE_DORKS.update(original_catalog)
+        os.chdir(previous_cwd)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    results = {}
+    for name, series in timings.items():
+        results[name] = {metric: round(statistics.median(values), 3) for metric, values in series.items()}
+        results[name]['worst_latency_ms'] = round(max(series['max_latency_ms']), 3)
+
+    growth = memory_after_cycle[-1] - memory_after_cycle[0] if len(memory_after_cycle) > 1 else 0
+    return {
+        'meta': {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'tk': tk.TkVersion,
+            'platform': platform.platform(),
+            'templates': args.templates,
+            'domains': args.domains,
+            'repeats': args.repeats,
+        },
+        'operations': results,
+        'queries_text': {
+            'insert_ms': round(statistics.median(insert_ms), 3),
+            'lines_rendered': lines_rendered[-1] if lines_rendered else 0,
+        },
+        'memory': {
+            'rss_growth_bytes': growth,
+            'rss_growth_per_cycle_bytes': growth // max(1, len(memory_after_cycle) - 1),
+            'rss_peak_bytes': max(memory_after_cycle, default=0),
+        },
+    }
+
+
+def flatten_metrics(report):
+    """Comparable metrics as {'operations.generate.duration_ms': value}"""
+    metrics = {}
+    for name, values in report.get('operations', {}).items():
+        for metric, value in values.items():
+            metrics[f"operations.{name}.{metric}"] = value
+    metrics['queries_text.insert_ms'] = report.get('queries_text', {}).get('insert_ms', 0)
+    metrics['memory.rss_growth_per_cycle_bytes'] = report.get('memory', {}).get('rss_growth_per_cycle_bytes', 0)
+    metrics['memory.rss_peak_bytes'] = report.get('memory', {}).get('rss_peak_bytes', 0)
+    return metrics
+
+
+def find_regressions(report, baseline, threshold, floor_ms=2.0):
+    """
+    Compare a report against a baseline report
+
+    A metric regresses when it is more than `threshold` (fractional) worse
+    than the baseline. Millisecond metrics below `floor_ms` are ignored
+    because they are dominated by scheduler noise.
+    """
+    current = flatten_metrics(report)
+    previous = flatten_metrics(baseline)
+    regressions = []
+    for key, value in current.items():
+        before = previous.get(key)
+        if before is None:
+            continue
+        if key.endswith('_ms') and max(value, before) < floor_ms:
+            continue
+        if before > 0 and value > before * (1 + threshold):
+            regressions.append({'metric': key, 'baseline': before, 'current': value,
+                                'change': round(value / before - 1, 3)})
+    return regressions
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="RECON-OPS GUI responsiveness benchmark")
+    parser.add_argument('--templates', type=int, default=2000, help="Synthetic catalog size (default: 2000)")
+    parser.add_argument('--domains', type=int, default=10, help="Synthetic target count (default: 10)")
+    parser.add_argument('--repeats', type=int, default=5, help="Generate/copy/export/clear cycles (default: 5)")
+    parser.add_argument('--baseline', help="Previous report to compare against")
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help="Fractional slowdown counted as a regression (default: 0.25)")
+    parser.add_argument('-o', '--output', help="Write the JSON report here (default: stdout)")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    xvfb = None
+    try:
+        xvfb = start_virtual_display()
+        report = run_benchmark(args)
+    except Exception as e:
+        print(f"ERROR: Benchmark could not run: {e}", file=sys.stderr)
+        return 2
+    finally:
+        if xvfb is not None:
+            xvfb.terminate()
+            xvfb.wait(timeout=10)
+
+    report['regressions'] = []
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            report['regressions'] = find_regressions(report, json.load(f), args.threshold)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    return 1 if report['regressions'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
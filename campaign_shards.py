@@ -0,0 +1,392 @@
+"""
+Campaign Sharding Module
+Splits one campaign across several machines through a shared directory
+
+Layout of a queue directory:
+    campaign.json             Shard count, placeholder values and prune settings
+    shards/shard_0003.json    (domain, category, template) work units of a shard
+    shards/shard_0003.lock    Claim held by a node (refreshed while working)
+    shards/shard_0003.break   Short-lived guard held while a lock is being removed
+    shards/shard_0003.done    Completion marker written by the node that finished
+    results/shard_0003.txt    Generated queries of the shard
+"""
+
+import bisect
+import hashlib
+import json
+import os
+import socket
+import time
+import uuid
+from datetime import datetime
+
+from atomic_io import SHARED_FILE_MODE, create_temp, publish_file, write_json_atomic
+from dork_templates import DEFAULT_PRUNE_RULES, exclude_values, expand_template
+from google_dorks import GOOGLE_DORKS
+
+CAMPAIGN_FILE = 'campaign.json'
+VIRTUAL_NODES = 64
+DEFAULT_LEASE_SECONDS = 900
+GUARD_TIMEOUT_SECONDS = 30  # A removal guard older than this was left by a crashed node
+GUARD_WAIT_SECONDS = 2
+
+
+class LeaseLost(RuntimeError):
+    """The shard lock no longer belongs to this node (lease expired and was reclaimed)"""
+
+
+def _hash(text):
+    return int.from_bytes(hashlib.md5(text.encode('utf-8')).digest()[:8], 'big')
+
+
+class HashRing:
+    """Consistent hash ring mapping work keys to a fixed number of shards
+
+    Each shard owns VIRTUAL_NODES points on the ring, which keeps shard
+    sizes even. A key's shard depends only on the key and the shard count,
+    so every node computes the same partition without coordination.
+    """
+
+    def __init__(self, shard_count, replicas=VIRTUAL_NODES):
+        if shard_count <= 0:
+            raise ValueError("Shard count must be positive")
+        self.shard_count = shard_count
+        points = sorted((_hash(f"shard-{shard}#{replica}"), shard)
+                        for shard in range(shard_count)
+                        for replica in range(replicas))
+        self._points = [point for point, _shard in points]
+        self._shards = [shard for _point, shard in points]
+
+    def shard_for(self, key):
+        index = bisect.bisect(self._points, _hash(key)) % len(self._points)
+        return self._shards[index]
+
+
+def work_unit_key(domain, template):
+    """Key a (domain, template) unit by content so catalog reordering keeps shards stable"""
+    return f"{domain}\t{template}"
+
+
+def shard_name(shard):
+    return f"shard_{shard:04d}"
+
+
+def init_campaign(queue_dir, domains, shard_count, categories=None, values=None, exclude=None, allowed=None):
+    """
+    Partition a campaign and write its shard manifests
+
+    Args:
+        queue_dir (str): Shared directory (network share or local stand-in)
+        domains (list): Cleaned target domains
+        shard_count (int): Number of shards
+        categories (list): Categories to include (all when None)
+        values (dict): Placeholder values shared by every node
+        exclude (dict): Field -> values pruned during expansion
+        allowed (set): Restrict to these templates (all when None)
+
+    Returns:
+        list: Number of work units per shard
+    """
+    categories = categories or list(GOOGLE_DORKS.keys())
+    if os.path.exists(os.path.join(queue_dir, CAMPAIGN_FILE)):
+        raise ValueError(f"Campaign already initialized in {queue_dir}")
+
+    ring = HashRing(shard_count)
+    shards = [[] for _ in range(shard_count)]
+    for domain in domains:
+        for category in categories:
+            for template in GOOGLE_DORKS.get(category, ()):
+                if allowed is not None and template not in allowed:
+                    continue
+                shard = ring.shard_for(work_unit_key(domain, template))
+                shards[shard].append([domain, category, template])
+
+    os.makedirs(os.path.join(queue_dir, 'shards'), exist_ok=True)
+    os.makedirs(os.path.join(queue_dir, 'results'), exist_ok=True)
+    for shard, units in enumerate(shards):
+        write_json_atomic(os.path.join(queue_dir, 'shards', f"{shard_name(shard)}.json"),
+                          {'shard': shard, 'units': units}, SHARED_FILE_MODE)
+
+    write_json_atomic(os.path.join(queue_dir, CAMPAIGN_FILE), {
+        'shard_count': shard_count,
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'values': values or {},
+        'exclude': exclude or {},
+    }, SHARED_FILE_MODE)
+    return [len(units) for units in shards]
+
+
+def load_campaign(queue_dir):
+    with open(os.path.join(queue_dir, CAMPAIGN_FILE), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+class ShardWorker:
+    """Claim and process shards of a campaign through lock files
+
+    A claim is a lock file created with O_CREAT | O_EXCL, which only one
+    node can win. The lock records the owner's node id and a claim token.
+    Workers refresh the lock while running. A lock older than the lease is
+    treated as abandoned by a node that left or crashed, and may be broken
+    by anyone.
+
+    Locks are only ever deleted while holding the shard's removal guard
+    (another O_EXCL file), after re-reading the lock under the guard. A
+    breaker therefore removes exactly the stale lock it inspected, and a
+    releasing node removes only its own lock. A node that stalled past its
+    lease sees a foreign or missing lock at its next heartbeat. It then
+    drops the shard without publishing anything. Results are written
+    atomically before the done marker, so a shard is either complete or
+    will be redone in full.
+    """
+
+    def __init__(self, queue_dir, node_id=None, lease_seconds=DEFAULT_LEASE_SECONDS):
+        self.queue_dir = queue_dir
+        self.node_id = node_id or f"{socket.gethostname()}-{os.getpid()}"
+        self.lease_seconds = lease_seconds
+        self.campaign = load_campaign(queue_dir)
+        self.shard_count = self.campaign['shard_count']
+        self.tokens = {}  # Shard -> token written into the lock this node holds
+
+    def _path(self, shard, suffix):
+        return os.path.join(self.queue_dir, 'shards', f"{shard_name(shard)}{suffix}")
+
+    def is_done(self, shard):
+        return os.path.exists(self._path(shard, '.done'))
+
+    @staticmethod
+    def _read_lock(lock_path):
+        """Owner record of a lock, {} when it is being written, None when absent"""
+        try:
+            with open(lock_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            return {}
+
+    def _acquire_guard(self, shard):
+        """Take the shard's removal guard, waiting briefly if another node holds it"""
+        guard_path = self._path(shard, '.break')
+        deadline = time.time() + GUARD_WAIT_SECONDS
+        while True:
+            try:
+                os.close(os.open(guard_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                return True
+            except FileExistsError:
+                try:
+                    if time.time() - os.path.getmtime(guard_path) > GUARD_TIMEOUT_SECONDS:
+                        os.unlink(guard_path)  # Holder crashed mid-removal
+                        continue
+                except OSError:
+                    continue
+            if time.time() >= deadline:
+                return False
+            time.sleep(0.05)
+
+    def _release_guard(self, shard):
+        try:
+            os.unlink(self._path(shard, '.break'))
+        except FileNotFoundError:
+            pass
+
+    def _break_stale_lock(self, shard):
+        """Remove an expired lock; re-checked under the removal guard so only that lock goes"""
+        lock_path = self._path(shard, '.lock')
+        try:
+            if time.time() - os.path.getmtime(lock_path) < self.lease_seconds:
+                return False
+        except OSError:
+            return True  # Released meanwhile - the shard is free to claim
+        if not self._acquire_guard(shard):
+            return False
+        try:
+            if time.time() - os.path.getmtime(lock_path) < self.lease_seconds:
+                return False  # Re-claimed or refreshed while we waited
+            os.unlink(lock_path)
+            return True
+        except OSError:
+            return True
+        finally:
+            self._release_guard(shard)
+
+    def owns(self, shard):
+        """True while this node's claim is the lock on disk"""
+        lock = self._read_lock(self._path(shard, '.lock'))
+        return bool(lock) and lock.get('node') == self.node_id and lock.get('token') == self.tokens.get(shard)
+
+    def try_claim(self, shard):
+        """Try to take the lock of one shard"""
+        if self.is_done(shard):
+            return False
+        lock_path = self._path(shard, '.lock')
+        for _attempt in range(2):
+            try:
+                fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, SHARED_FILE_MODE)
+            except FileExistsError:
+                if not self._break_stale_lock(shard):
+                    return False
+                continue
+            os.chmod(lock_path, SHARED_FILE_MODE)
+            token = uuid.uuid4().hex
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({'node': self.node_id, 'token': token, 'claimed': time.time()}, f)
+            self.tokens[shard] = token
+            if self.is_done(shard):
+                # Finished by a previous owner between our checks
+                self.release(shard)
+                return False
+            return True
+        return False
+
+    def claim_next(self):
+        """
+        Claim the next available shard
+
+        Nodes start scanning at a node-specific offset so a fleet starting at
+        the same time does not contend for shard 0.
+
+        Returns:
+            int or None: Claimed shard number, None when nothing is left
+        """
+        start = _hash(self.node_id) % self.shard_count
+        for step in range(self.shard_count):
+            shard = (start + step) % self.shard_count
+            if self.try_claim(shard):
+                return shard
+        return None
+
+    def heartbeat(self, shard):
+        """
+        Refresh the lease of a claimed shard
+
+        Raises:
+            LeaseLost: The lock expired and was broken or re-claimed by another node
+        """
+        if not self.owns(shard):
+            raise LeaseLost(f"Lease on {shard_name(shard)} was lost")
+        try:
+            os.utime(self._path(shard, '.lock'))
+        except FileNotFoundError:
+            raise LeaseLost(f"Lease on {shard_name(shard)} was lost")
+
+    def release(self, shard):
+        """Give a claimed shard back (node leaving or shard done); never touches another node's lock"""
+        token = self.tokens.pop(shard, None)
+        if token is None or not self._acquire_guard(shard):
+            return
+        try:
+            lock = self._read_lock(self._path(shard, '.lock'))
+            if lock and lock.get('node') == self.node_id and lock.get('token') == token:
+                os.unlink(self._path(shard, '.lock'))
+        except FileNotFoundError:
+            pass
+        finally:
+            self._release_guard(shard)
+
+    def prune_rules(self):
+        rules = list(DEFAULT_PRUNE_RULES)
+        for field, blocked in self.campaign.get('exclude', {}).items():
+            rules.append(exclude_values(field, blocked))
+        return tuple(rules)
+
+    def process(self, shard):
+        """
+        Generate the queries of a claimed shard and mark it done
+
+        Returns:
+            int or None: Number of queries written, None when the lease was lost
+        """
+        with open(self._path(shard, '.json'), 'r', encoding='utf-8') as f:
+            units = json.load(f)['units']
+        values = self.campaign.get('values', {})
+        rules = self.prune_rules()
+
+        result_path = os.path.join(self.queue_dir, 'results', f"{shard_name(shard)}.txt")
+        fd, tmp_path = create_temp(result_path, suffix='.txt', mode=SHARED_FILE_MODE)
+        count = 0
+        last_beat = time.time()
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as out:
+                for domain, _category, template in units:
+                    for query in expand_template(template, values, rules, domain=domain):
+                        out.write(query + "\n")
+                        count += 1
+                    if time.time() - last_beat > self.lease_seconds / 3:
+                        self.heartbeat(shard)
+                        last_beat = time.time()
+            self.heartbeat(shard)  # Publish only while the claim is still ours
+            publish_file(tmp_path, result_path, SHARED_FILE_MODE)
+        except LeaseLost:
+            os.unlink(tmp_path)
+            self.tokens.pop(shard, None)
+            return None
+        except BaseException:
+            os.unlink(tmp_path)
+            self.release(shard)
+            raise
+
+        write_json_atomic(self._path(shard, '.done'), {
+            'node': self.node_id,
+            'queries': count,
+            'units': len(units),
+            'finished': datetime.now().isoformat(timespec='seconds'),
+        }, SHARED_FILE_MODE)
+        self.release(shard)
+        return count
+
+    def run(self):
+        """
+        Work until no claimable shard is left
+
+        Returns:
+            list: (shard, query count) for every shard this node completed
+        """
+        completed = []
+        while True:
+            shard = self.claim_next()
+            if shard is None:
+                return completed
+            count = self.process(shard)
+            if count is not None:
+                completed.append((shard, count))
+
+
+def campaign_status(queue_dir):
+    """
+    Summarize shard progress
+
+    Returns:
+        dict: Lists of done, claimed and open shard numbers
+    """
+    shard_count = load_campaign(queue_dir)['shard_count']
+    status = {'done': [], 'claimed': [], 'open': []}
+    for shard in range(shard_count):
+        base = os.path.join(queue_dir, 'shards', shard_name(shard))
+        if os.path.exists(f"{base}.done"):
+            status['done'].append(shard)
+        elif os.path.exists(f"{base}.lock"):
+            status['claimed'].append(shard)
+        else:
+            status['open'].append(shard)
+    return status
+
+
+def merge_results(queue_dir, output_path):
+    """
+    Concatenate the results of all finished shards in shard order
+
+    Returns:
+        tuple: (queries merged, list of shards still missing)
+    """
+    status = campaign_status(queue_dir)
+    missing = status['claimed'] + status['open']
+    total = 0
+    with open(output_path, 'w', encoding='utf-8') as out:
+        for shard in status['done']:
+            result_path = os.path.join(queue_dir, 'results', f"{shard_name(shard)}.txt")
+            with open(result_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    out.write(line)
+                    total += 1
+    return total, sorted(missing)
@@ -0,0 +1,131 @@
+"""
+Dork Catalog Hot Reload Module
+Polls dork source files for changes and reloads GOOGLE_DORKS in place,
+reporting which categories changed
+"""
+
+import ast
+import os
+
+from google_dorks import CATEGORY_PRIORITIES, GOOGLE_DORKS, TEMPLATE_PRIORITIES
+
+# Module level literals that are reloaded from a changed source file
+RELOADABLE_NAMES = ('GOOGLE_DORKS', 'CATEGORY_PRIORITIES', 'TEMPLATE_PRIORITIES')
+
+
+def extract_literals(source, names=RELOADABLE_NAMES):
+    """
+    Read literal assignments from dork source without executing it
+
+    Args:
+        source (str): Python source of a dork file
+        names (tuple): Module level names to extract
+
+    Returns:
+        dict: Name mapped to its literal value (missing names are omitted)
+
+    Raises:
+        SyntaxError, ValueError: The file is mid-edit or not a pure literal
+    """
+    found = {}
+    for node in ast.parse(source).body:
+        if not isinstance(node, ast.Assign):
+            continue
+        for target in node.targets:
+            if isinstance(target, ast.Name) and target.id in names:
+                found[target.id] = ast.literal_eval(node.value)
+    return found
+
+
+def diff_catalogs(old, new):
+    """
+    Compare two catalogs category by category
+
+    Returns:
+        tuple: (added, removed, changed) category name lists
+    """
+    added = [category for category in new if category not in old]
+    removed = [category for category in old if category not in new]
+    changed = [category for category in new if category in old and old[category] != new[category]]
+    return added, removed, changed
+
+
+class CatalogWatcher:
+    """Poll dork source files by mtime and hot-apply their catalogs
+
+    Every watched file may define GOOGLE_DORKS (merged in path order) and
+    optionally priority tables. Changes are applied by mutating the live
+    dictionaries in place so every module holding a reference sees them.
+    A file that fails to parse (e.g. saved mid-edit) leaves the last good
+    catalog untouched until the next successful poll.
+    """
+
+    def __init__(self, paths=None, catalog=GOOGLE_DORKS):
+        import google_dorks
+        self.paths = [os.path.abspath(p) for p in (paths or [google_dorks.__file__])]
+        self.catalog = catalog
+        self.last_error = None
+        self._stamps = {path: self._stamp(path) for path in self.paths}
+
+    @staticmethod
+    def _stamp(path):
+        try:
+            stat = os.stat(path)
+            return (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            return None
+
+    def poll(self):
+        """
+        Check the watched files and apply any changes
+
+        Returns:
+            dict or None: {'added', 'removed', 'changed'} category lists when the
+            catalog changed, {'error'} when a changed file could not be read,
+            else None
+        """
+        dirty = False
+        for path in self.paths:
+            stamp = self._stamp(path)
+            if stamp != self._stamps.get(path):
+                self._stamps[path] = stamp
+                dirty = True
+        if not dirty:
+            return None
+        return self.reload()
+
+    def reload(self):
+        """Re-read every watched file and apply the merged catalog"""
+        merged = {}
+        priorities = {}
+        template_priorities = {}
+        try:
+            for path in self.paths:
+                with open(path, 'r', encoding='utf-8') as f:
+                    literals = extract_literals(f.read())
+                merged.update(literals.get('GOOGLE_DORKS', {}))
+                priorities.update(literals.get('CATEGORY_PRIORITIES', {}))
+                template_priorities.update(literals.get('TEMPLATE_PRIORITIES', {}))
+        except (OSError, SyntaxError, ValueError) as e:
+            self.last_error = str(e)
+            return {'error': self.last_error}
+        if not merged:
+            self.last_error = "No GOOGLE_DORKS found in watched files"
+            return {'error': self.last_error}
+        self.last_error = None
+
+        # Mutate in place - recon_ops and the other modules share these objects
+        if priorities:
+            CATEGORY_PRIORITIES.clear()
+            CATEGORY_PRIORITIES.update(priorities)
+        if template_priorities:
+            TEMPLATE_PRIORITIES.clear()
+            TEMPLATE_PRIORITIES.update(template_priorities)
+
+        added, removed, changed = diff_catalogs(self.catalog, merged)
+        if not (added or removed or changed or list(self.catalog) != list(merged)):
+            return None
+
+        self.catalog.clear()
+        self.catalog.update({category: list(templates) for category, templates in merged.items()})
+        return {'added': added, 'removed': removed, 'changed': changed}
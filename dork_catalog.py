@@ -0,0 +1,269 @@
+"""
+Columnar Dork Catalog Module
+Compiles GOOGLE_DORKS into one array per field with precomputed metadata
+and bitmap indexes, so filters such as "filetype:sql or env under 20 terms"
+are answered with a handful of integer AND/OR operations
+
+Bitmaps are plain Python ints (bit i = row i). Big-int bitwise operations
+run word by word in C, so combining masks over 50k templates costs
+microseconds without adding a dependency.
+"""
+
+import re
+from array import array
+from bisect import bisect_right
+from functools import lru_cache
+
+from google_dorks import GOOGLE_DORKS, get_template_priority
+
+KNOWN_OPERATORS = ('site', 'filetype', 'ext', 'inurl', 'intitle', 'intext',
+                   'allinurl', 'allintitle', 'allintext', 'cache', 'related')
+
+RISK_LEVELS = ('low', 'medium', 'high', 'critical')
+
+_OPERATOR_RE = re.compile(r'(?<![\w.])-?(' + '|'.join(KNOWN_OPERATORS) + r'):("[^"]*"|[^\s()]*)')
+_TERM_RE = re.compile(r'-?\w+:"[^"]*"|-?\w+:[^\s()]+|"[^"]*"|[^\s()"]+')
+_QUOTED_EXT_RE = re.compile(r'"[^"\s]*\.([A-Za-z0-9]{1,8})"')
+
+
+def risk_for_priority(priority):
+    """Map a scheduling priority onto a risk tag"""
+    if priority >= 9:
+        return 'critical'
+    if priority >= 7:
+        return 'high'
+    if priority >= 5:
+        return 'medium'
+    return 'low'
+
+
+@lru_cache(maxsize=None)
+def analyze_template(template):
+    """
+    Precompute the filterable metadata of a template
+
+    Cached per template string, so recompiling after a hot reload only
+    analyzes templates that are new.
+
+    Returns:
+        tuple: (operators, filetypes, term_count, length)
+    """
+    operators = set()
+    filetypes = set()
+    for operator, value in _OPERATOR_RE.findall(template):
+        operators.add(operator)
+        if operator in ('filetype', 'ext') and value and '{' not in value:
+            filetypes.add(value.strip('"').lower())
+    for extension in _QUOTED_EXT_RE.findall(template):
+        filetypes.add(extension.lower())
+    terms = [term for term in _TERM_RE.findall(template) if term not in ('OR', 'AND', '|', '+')]
+    return frozenset(operators), frozenset(filetypes), len(terms), len(template)
+
+
+def mask_from_rows(rows, size):
+    """Build a bitmap from row numbers in one pass (avoids O(n^2) big-int ORs)"""
+    bits = bytearray((size + 7) // 8)
+    for row in rows:
+        bits[row >> 3] |= 1 << (row & 7)
+    return int.from_bytes(bits, 'little')
+
+
+def _cumulative_masks(values):
+    """Masks for "value <= threshold" at every distinct value, for bisect lookup"""
+    by_value = {}
+    for row, value in enumerate(values):
+        by_value.setdefault(value, []).append(row)
+    thresholds = sorted(by_value)
+    masks = []
+    running = 0
+    for value in thresholds:
+        running |= mask_from_rows(by_value[value], len(values))
+        masks.append(running)
+    return thresholds, masks
+
+
+class ColumnarCatalog:
+    """Column-per-field view of a dork catalog with bitmap indexes
+
+    Columns (one entry per template row):
+        category, template, operators, filetypes, risk   - lists
+        term_count, length, priority                     - compact arrays
+
+    Usage:
+        table = ColumnarCatalog()
+        mask = (table.filetype_mask('sql', 'env') & table.terms_at_most(19))
+        for category, template in table.select(mask):
+            ...
+    """
+
+    def __init__(self, catalog=None):
+        catalog = GOOGLE_DORKS if catalog is None else catalog
+        self.category = []
+        self.template = []
+        self.operators = []
+        self.filetypes = []
+        self.risk = []
+        self.term_count = array('H')
+        self.length = array('I')
+        self.priority = array('h')
+
+        self.operator_index = {}
+        self.filetype_index = {}
+        self.risk_index = {}
+        self.category_index = {}
+
+        self._index_rows = {'operator': {}, 'filetype': {}, 'risk': {}, 'category': {}}
+        for category, templates in catalog.items():
+            for template in templates:
+                self._append(category, template)
+
+        size = len(self.template)
+        for name, index in (('operator', self.operator_index), ('filetype', self.filetype_index),
+                            ('risk', self.risk_index), ('category', self.category_index)):
+            for key, rows in self._index_rows[name].items():
+                index[key] = mask_from_rows(rows, size)
+        del self._index_rows
+
+        self.all_mask = (1 << len(self.template)) - 1
+        self._term_thresholds, self._term_masks = _cumulative_masks(self.term_count)
+        self._length_thresholds, self._length_masks = _cumulative_masks(self.length)
+
+    def _append(self, category, template):
+        row = len(self.template)
+        operators, filetypes, term_count, length = analyze_template(template)
+        priority = get_template_priority(category, template)
+        risk = risk_for_priority(priority)
+
+        self.category.append(category)
+        self.template.append(template)
+        self.operators.append(operators)
+        self.filetypes.append(filetypes)
+        self.risk.append(risk)
+        self.term_count.append(term_count)
+        self.length.append(length)
+        self.priority.append(priority)
+
+        rows = self._index_rows
+        for operator in operators:
+            rows['operator'].setdefault(operator, []).append(row)
+        for filetype in filetypes:
+            rows['filetype'].setdefault(filetype, []).append(row)
+        rows['risk'].setdefault(risk, []).append(row)
+        rows['category'].setdefault(category, []).append(row)
+
+    def __len__(self):
+        return len(self.template)
+
+    # --- Mask builders -------------------------------------------------
+
+    def operator_mask(self, *operators):
+        """Rows using any of the operators (e.g. 'filetype', 'inurl')"""
+        mask = 0
+        for operator in operators:
+            mask |= self.operator_index.get(operator.rstrip(':').lower(), 0)
+        return mask
+
+    def filetype_mask(self, *filetypes):
+        """Rows referencing any of the filetypes/extensions (e.g. 'sql', 'env')"""
+        mask = 0
+        for filetype in filetypes:
+            mask |= self.filetype_index.get(filetype.lstrip('.').lower(), 0)
+        return mask
+
+    def category_mask(self, *categories):
+        mask = 0
+        for category in categories:
+            mask |= self.category_index.get(category, 0)
+        return mask
+
+    def risk_at_least(self, level):
+        """Rows tagged with `level` or any higher risk"""
+        if level not in RISK_LEVELS:
+            raise ValueError(f"Unknown risk level '{level}' - expected one of {', '.join(RISK_LEVELS)}")
+        mask = 0
+        for name in RISK_LEVELS[RISK_LEVELS.index(level):]:
+            mask |= self.risk_index.get(name, 0)
+        return mask
+
+    def terms_at_most(self, count):
+        """Rows with term_count <= count"""
+        return self._at_most(self._term_thresholds, self._term_masks, count)
+
+    def length_at_most(self, length):
+        """Rows with length <= length"""
+        return self._at_most(self._length_thresholds, self._length_masks, length)
+
+    @staticmethod
+    def _at_most(thresholds, masks, limit):
+        position = bisect_right(thresholds, limit)
+        return masks[position - 1] if position else 0
+
+    # --- Results -------------------------------------------------------
+
+    @staticmethod
+    def iter_rows(mask):
+        """Row numbers set in a mask, ascending"""
+        while mask:
+            low = mask & -mask
+            yield low.bit_length() - 1
+            mask ^= low
+
+    def count(self, mask):
+        return bin(mask).count('1')
+
+    def select(self, mask):
+        """(category, template) pairs of the rows in a mask"""
+        return [(self.category[row], self.template[row]) for row in self.iter_rows(mask)]
+
+
+_FILTER_TERM_RE = re.compile(r'^(\w+)\s*(<=|>=|=|<|>)\s*(.+)$')
+
+
+def parse_filter(table, expression):
+    """
+    Turn a compact filter expression into a mask
+
+    Space separated clauses are ANDed; comma separated values are ORed.
+    Supported clauses:
+        op=filetype,inurl      filetype=sql,env       category=Log Files
+        terms<20  terms<=19    length<=120            risk>=high
+
+    Args:
+        table (ColumnarCatalog): Catalog to filter
+        expression (str): Filter expression
+
+    Returns:
+        int: Bitmap of matching rows
+    """
+    mask = table.all_mask
+    for clause in re.split(r'\s+(?=\w+\s*(?:<=|>=|=|<|>))', expression.strip()):
+        if not clause:
+            continue
+        match = _FILTER_TERM_RE.match(clause.strip())
+        if not match:
+            raise ValueError(f"Invalid filter clause '{clause}'")
+        field, comparison, raw = match.groups()
+        values = [value.strip() for value in raw.split(',') if value.strip()]
+
+        if field in ('op', 'operator') and comparison == '=':
+            mask &= table.operator_mask(*values)
+        elif field in ('filetype', 'ext') and comparison == '=':
+            mask &= table.filetype_mask(*values)
+        elif field == 'category' and comparison == '=':
+            mask &= table.category_mask(*values)
+        elif field == 'risk' and comparison in ('=', '>='):
+            mask &= table.risk_at_least(values[0]) if comparison == '>=' else table.risk_index.get(values[0], 0)
+        elif field in ('terms', 'length') and comparison in ('<', '<=', '>', '>='):
+            limit = int(values[0])
+            at_most = table.terms_at_most if field == 'terms' else table.length_at_most
+            if comparison == '<':
+                mask &= at_most(limit - 1)
+            elif comparison == '<=':
+                mask &= at_most(limit)
+            elif comparison == '>':
+                mask &= table.all_mask & ~at_most(limit)
+            else:
+                mask &= table.all_mask & ~at_most(limit - 1)
+        else:
+            raise ValueError(f"Unsupported filter clause '{clause}'")
+    return mask
@@ -0,0 +1,132 @@
+"""
+Dork Search Module
+Token and prefix inverted index over template text and category names
+for search-as-you-type over large dork libraries
+"""
+
+import re
+from bisect import bisect_left
+
+from dork_catalog import mask_from_rows
+from google_dorks import GOOGLE_DORKS, get_template_priority
+
+_TOKEN_RE = re.compile(r'[a-z0-9_]+(?:[.\-][a-z0-9_]+)*')
+_PREFIX_CACHE_SIZE = 256
+_SHORT_PREFIX = 2  # Prefixes up to this length are precomputed - they match the most tokens
+
+
+def tokenize(text):
+    """
+    Split text into lowercase search tokens
+
+    Dotted and dashed words are indexed whole and by part, so "config.php"
+    is found by "config.php", "config" and "php".
+    """
+    tokens = set()
+    for word in _TOKEN_RE.findall(text.lower()):
+        tokens.add(word)
+        if '.' in word or '-' in word:
+            tokens.update(part for part in re.split(r'[.\-]', word) if part)
+    return tokens
+
+
+class DorkSearchIndex:
+    """Inverted index mapping tokens to bitmaps of template rows
+
+    Every query word is treated as a prefix. The index keeps a sorted token
+    list, so the tokens with a prefix form one contiguous bisect range.
+    Words are ANDed. The masks of the very short prefixes are built up
+    front, because they span the most tokens. Longer prefix masks are
+    cached, because typing mostly extends the last word.
+    """
+
+    def __init__(self, catalog=None):
+        catalog = GOOGLE_DORKS if catalog is None else catalog
+        self.rows = []
+        priority_rows = {}
+        postings = {}
+        for category, templates in catalog.items():
+            category_tokens = tokenize(category)
+            for template in templates:
+                row = len(self.rows)
+                self.rows.append((category, template))
+                priority_rows.setdefault(get_template_priority(category, template), []).append(row)
+                for token in category_tokens | tokenize(template):
+                    postings.setdefault(token, []).append(row)
+
+        size = len(self.rows)
+        self.tokens = sorted(postings)
+        self.masks = [mask_from_rows(postings[token], size) for token in self.tokens]
+        self.all_mask = (1 << size) - 1
+
+        # Highest priority first - results are decoded level by level
+        self.priority_masks = [mask_from_rows(rows, size)
+                               for _priority, rows in sorted(priority_rows.items(), reverse=True)]
+
+        short_rows = {}
+        for token, rows in postings.items():
+            for length in range(1, min(_SHORT_PREFIX, len(token)) + 1):
+                short_rows.setdefault(token[:length], set()).update(rows)
+        self._short_prefixes = {prefix: mask_from_rows(rows, size) for prefix, rows in short_rows.items()}
+        self._prefix_cache = {}
+
+    def __len__(self):
+        return len(self.rows)
+
+    def prefix_mask(self, prefix):
+        """Bitmap of rows containing a token that starts with `prefix`"""
+        if len(prefix) <= _SHORT_PREFIX:
+            return self._short_prefixes.get(prefix, 0)
+        cached = self._prefix_cache.get(prefix)
+        if cached is not None:
+            return cached
+        mask = 0
+        position = bisect_left(self.tokens, prefix)
+        while position < len(self.tokens) and self.tokens[position].startswith(prefix):
+            mask |= self.masks[position]
+            position += 1
+        if len(self._prefix_cache) >= _PREFIX_CACHE_SIZE:
+            self._prefix_cache.clear()
+        self._prefix_cache[prefix] = mask
+        return mask
+
+    def search_mask(self, query):
+        """Bitmap of rows matching every word of the query as a prefix"""
+        words = _TOKEN_RE.findall(query.lower())
+        if not words:
+            return 0
+        mask = self.all_mask
+        for word in words:
+            mask &= self.prefix_mask(word)
+            if not mask:
+                break
+        return mask
+
+    def search(self, query, limit=200):
+        """
+        Find templates matching a search-as-you-type query
+
+        Args:
+            query (str): Words typed so far, e.g. "sql back"
+            limit (int): Maximum number of results
+
+        Returns:
+            tuple: (total matches, list of (category, template) ranked by
+            priority then catalog order)
+        """
+        mask = self.search_mask(query)
+        if not mask:
+            return 0, []
+        total = bin(mask).count('1')
+
+        # Decode only as many rows as are shown, best priority level first
+        results = []
+        for level_mask in self.priority_masks:
+            matched = mask & level_mask
+            while matched and len(results) < limit:
+                low = matched & -matched
+                results.append(self.rows[low.bit_length() - 1])
+                matched ^= low
+            if len(results) >= limit:
+                break
+        return total, results
@@ -0,0 +1,189 @@
+"""
+Dork Template Expansion Module
+Lazily expands dork templates with placeholders beyond {domain}
+(e.g. {keyword}, {filetype}, {year}) over lists of values
+"""
+
+import string
+from datetime import datetime
+from functools import lru_cache
+
+_FORMATTER = string.Formatter()
+
+
+@lru_cache(maxsize=None)
+def template_fields(template):
+    """
+    Get the placeholder names used by a template, in first-use order
+
+    Args:
+        template (str): Dork template such as 'site:{domain} "{keyword}"'
+
+    Returns:
+        tuple: Placeholder names such as ('domain', 'keyword')
+    """
+    fields = []
+    for _literal, field, _spec, _conv in _FORMATTER.parse(template):
+        if field and field not in fields:
+            fields.append(field)
+    return tuple(fields)
+
+
+class PruneRule:
+    """Reject combinations of placeholder values during expansion
+
+    The predicate receives the bound values of `fields` (in order) and
+    returns False to drop the combination. Rules are checked as soon as
+    all of their fields are bound, so a rejected prefix prunes every
+    combination below it instead of filtering the full product.
+    """
+
+    def __init__(self, fields, predicate, description=""):
+        self.fields = tuple(fields)
+        self.predicate = predicate
+        self.description = description
+
+    def allows(self, bindings):
+        return self.predicate(*(bindings[field] for field in self.fields))
+
+
+def exclude_values(field, values):
+    """Rule dropping any combination where `field` takes one of `values`"""
+    blocked = frozenset(values)
+    return PruneRule((field,), lambda value: value not in blocked,
+                     f"exclude {field}={','.join(sorted(blocked))}")
+
+
+def valid_year(field='year'):
+    """Rule dropping years that are malformed or in the future"""
+    current = datetime.now().year
+    return PruneRule((field,), lambda value: value.isdigit() and 1990 <= int(value) <= current,
+                     f"{field} between 1990 and {current}")
+
+
+DEFAULT_PRUNE_RULES = (valid_year(),)
+
+
+def parse_param_spec(spec):
+    """
+    Parse placeholder values typed in the UI or on the command line
+
+    Args:
+        spec (str): Text such as "keyword=admin,login; year=2023,2024"
+
+    Returns:
+        dict: Field name mapped to a list of unique values
+    """
+    values = {}
+    for part in spec.replace('\n', ';').split(';'):
+        if not part.strip():
+            continue
+        if '=' not in part:
+            raise ValueError(f"Invalid parameter '{part.strip()}' - expected name=value1,value2")
+        name, raw = part.split('=', 1)
+        name = name.strip()
+        if not name.isidentifier():
+            raise ValueError(f"Invalid parameter name '{name}'")
+        bucket = values.setdefault(name, [])
+        for value in raw.split(','):
+            value = value.strip()
+            if value and value not in bucket:
+                bucket.append(value)
+    return values
+
+
+def merge_param_values(defaults, overrides):
+    """Overlay user supplied value lists on the defaults, field by field"""
+    merged = {name: list(values) for name, values in defaults.items()}
+    for name, values in overrides.items():
+        merged[name] = list(values)
+    return merged
+
+
+def estimate_expansion_count(template, values, fixed=('domain',)):
+    """
+    Upper bound on the number of queries a template expands to
+
+    The bound is the size of the cartesian product before pruning, so it is
+    computed in O(fields) without generating anything.
+
+    Args:
+        template (str): Dork template
+        values (dict): Field name mapped to a list of values
+        fixed (tuple): Fields bound once per target (not expanded)
+
+    Returns:
+        int: Product of the value list sizes (0 when a field has no values)
+    """
+    count = 1
+    for field in template_fields(template):
+        if field in fixed:
+            continue
+        count *= len(values.get(field, ()))
+        if not count:
+            return 0
+    return count
+
+
+def estimate_catalog_count(catalog, values, categories=None, domains=1):
+    """
+    Upper bound on the queries a whole catalog expands to
+
+    Args:
+        catalog (dict): Category mapped to a list of templates
+        values (dict): Field name mapped to a list of values
+        categories (list): Categories to include (all when None)
+        domains (int): Number of targets
+
+    Returns:
+        int: Estimated total query count
+    """
+    categories = catalog.keys() if categories is None else categories
+    per_domain = sum(estimate_expansion_count(template, values)
+                     for category in categories
+                     for template in catalog.get(category, ()))
+    return per_domain * domains
+
+
+def expand_template(template, values, rules=DEFAULT_PRUNE_RULES, **fixed):
+    """
+    Stream every expansion of a template without materializing the product
+
+    Args:
+        template (str): Dork template
+        values (dict): Field name mapped to a list of values
+        rules (tuple): PruneRule objects applied to partial combinations
+        **fixed: Fields bound to a single value (e.g. domain="example.com")
+
+    Yields:
+        str: Formatted query
+    """
+    fields = template_fields(template)
+    free = [field for field in fields if field not in fixed]
+    if any(not values.get(field) for field in free):
+        return  # A placeholder without values can never be filled
+
+    bindings = dict(fixed)
+
+    # Attach each applicable rule to the position where its last field is bound
+    checks = [[] for _ in range(len(free) + 1)]
+    for rule in rules:
+        if not set(rule.fields) <= set(fields):
+            continue
+        position = max((free.index(f) + 1 for f in rule.fields if f in free), default=0)
+        checks[position].append(rule)
+
+    if not all(rule.allows(bindings) for rule in checks[0]):
+        return
+
+    def expand(position):
+        if position == len(free):
+            yield template.format(**bindings)
+            return
+        field = free[position]
+        for value in values[field]:
+            bindings[field] = value
+            if all(rule.allows(bindings) for rule in checks[position + 1]):
+                yield from expand(position + 1)
+
+    yield from expand(0)
@@ -3,6 +3,10 @@ Google Dorking Queries Module
 Contains comprehensive list of Google dork queries for security testing
 """
 
+from datetime import datetime
+
+from dork_templates import DEFAULT_PRUNE_RULES, expand_template
+
 GOOGLE_DORKS = {
     "Document Files": [
         'site:{domain} (filetype:pdf OR filetype:doc OR filetype:docx OR filetype:xls OR filetype:xlsx OR filetype:ppt OR filetype:pptx)',
@@ -140,22 +144,124 @@ GOOGLE_DORKS = {
         'site:{domain} ("grafana" OR "kibana" OR "elasticsearch" OR "prometheus" OR "nagios")',
         'site:{domain} ("splunk" OR "logstash" OR "fluentd" OR "graylog" OR "syslog")',
         'site:{domain} ("google analytics" OR "gtag" OR "ga(" OR "_gaq" OR "gtm")',
+    ],
+    
+    "Keyword Hunting": [
+        'site:{domain} "{keyword}" filetype:{filetype}',
+        'site:{domain} intitle:"{keyword}" "{year}"',
+        'site:{domain} inurl:{keyword} (filetype:{filetype} OR ext:{filetype})',
+        'site:{domain} "{keyword}" "{year}" filetype:{filetype}',
     ]
 }
 
-def get_all_dorks_for_domain(domain):
+# Default values for placeholders other than {domain}
+# Overridden per field from the UI or the command line (e.g. "keyword=vpn,payroll")
+TEMPLATE_PARAMETERS = {
+    'keyword': ['confidential', 'internal use only', 'password'],
+    'filetype': ['pdf', 'xlsx', 'docx'],
+    'year': [str(datetime.now().year - offset) for offset in range(3)],
+}
+
+# Priority weights used by the budget scheduler (higher runs first)
+CATEGORY_PRIORITIES = {
+    "Passwords & Credentials": 10,
+    "Security & Certificates": 9,
+    "Configuration Files": 9,
+    "Sensitive Info": 9,
+    "Database Files": 8,
+    "Backup & Temp Files": 7,
+    "Git & Version Control": 7,
+    "Directory Listings": 6,
+    "Log Files": 6,
+    "Login & Admin Pages": 6,
+    "Sensitive Documents": 6,
+    "Cloud & API Info": 5,
+    "Development & Testing": 5,
+    "Error & Debug Info": 5,
+    "Source Code Files": 5,
+    "Vulnerable Parameters": 5,
+    "Document Files": 4,
+    "Keyword Hunting": 4,
+    "Email & Communications": 3,
+    "Monitoring & Analytics": 3,
+    "Network & Infrastructure": 3,
+    "Technology Stack": 2,
+}
+
+DEFAULT_PRIORITY = 1
+
+# Per-template overrides for templates worth more (or less) than their category
+TEMPLATE_PRIORITIES = {
+    'site:{domain} (filetype:env OR filetype:config OR filetype:ini OR filetype:conf OR filetype:cnf OR filetype:cfg)': 10,
+    'site:{domain} ("BEGIN PRIVATE KEY" OR "BEGIN CERTIFICATE" OR "BEGIN RSA PRIVATE KEY")': 10,
+    'site:{domain} ("api_key" OR "apikey" OR "token" OR "auth_token" OR "access_token")': 10,
+    'site:{domain} (filetype:gitignore OR ".gitignore" OR ".gitconfig" OR "git-credentials")': 9,
+    'site:{domain} ("database.sql" OR "backup.sql" OR "dump.sql" OR "data.sql" OR "export.sql")': 9,
+    'site:{domain} ("username" OR "user" OR "email" OR "mail" OR "contact")': 4,
+    'site:{domain} ("commit" OR "branch" OR "merge" OR "pull request" OR "diff")': 3,
+}
+
+def get_template_priority(category, template):
+    """
+    Get the scheduling weight of a dork template
+    
+    Args:
+        category (str): Category the template belongs to
+        template (str): The dork template
+        
+    Returns:
+        int: Template override, else category weight, else DEFAULT_PRIORITY
+    """
+    if template in TEMPLATE_PRIORITIES:
+        return TEMPLATE_PRIORITIES[template]
+    return CATEGORY_PRIORITIES.get(category, DEFAULT_PRIORITY)
+
+def clean_domain(domain):
+    """
+    Normalize a user supplied target into a bare domain
+    
+    Args:
+        domain (str): Raw target such as "https://www.example.com/"
+        
+    Returns:
+        str: Bare domain such as "example.com"
+    """
+    return domain.strip().replace('http://', '').replace('https://', '').replace('www.', '').strip('/')
+
+def iter_category_queries(domain, category, values=None, rules=DEFAULT_PRUNE_RULES, allowed=None):
+    """
+    Stream the formatted queries of one category for a domain
+    
+    Args:
+        domain (str): The target domain
+        category (str): Category name in GOOGLE_DORKS
+        values (dict): Placeholder values (TEMPLATE_PARAMETERS when None)
+        rules (tuple): Prune rules applied during expansion
+        allowed (set): Restrict to these templates (all when None)
+        
+    Yields:
+        str: Formatted query
+    """
+    values = TEMPLATE_PARAMETERS if values is None else values
+    for dork in GOOGLE_DORKS.get(category, ()):
+        if allowed is not None and dork not in allowed:
+            continue
+        yield from expand_template(dork, values, rules, domain=domain)
+
+def get_all_dorks_for_domain(domain, values=None):
     """
     Get all Google dork queries for a specific domain
     
     Args:
         domain (str): The target domain
+        values (dict): Placeholder values (TEMPLATE_PARAMETERS when None)
         
     Returns:
         dict: Dictionary with categories and formatted queries
     """
     formatted_dorks = {}
-    for category, dorks in GOOGLE_DORKS.items():
-        formatted_dorks[category] = [dork.format(domain=domain) for dork in dorks]
+    for category in GOOGLE_DORKS:
+        formatted_dorks[category] = list(iter_category_queries(domain, category, values))
     
     return formatted_dorks
 
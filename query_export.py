@@ -0,0 +1,345 @@
+"""
+Multi-Format Query Export Module
+Walks the generated queries once and fans every record out to TXT, CSV and
+JSONL.gz writers. Compression runs on worker threads, every file is written
+atomically and a checksum manifest is written alongside
+"""
+
+import csv
+import hashlib
+import io
+import json
+import os
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from json.encoder import encode_basestring
+
+from atomic_io import create_temp, publish_file, write_json_atomic
+
+EXPORT_FORMATS = ('txt', 'csv', 'jsonl.gz')
+CHUNK_BYTES = 1 << 20   # Encoded bytes buffered per writer before a flush / compression job
+CHUNK_ROWS = 8192       # CSV rows batched per writerows() call
+
+
+def gzip_member(data, compresslevel=6):
+    """Compress bytes into one complete gzip member (zlib releases the GIL while it works)"""
+    compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, 31)  # wbits 31 = gzip container
+    return compressor.compress(data) + compressor.flush()
+
+
+def parse_formats(spec):
+    """
+    Parse a comma separated format list such as "txt,jsonl.gz"
+
+    Raises:
+        ValueError: Unknown or empty format list
+    """
+    formats = []
+    for name in spec.split(','):
+        name = name.strip().lower().lstrip('.')
+        if not name:
+            continue
+        if name not in EXPORT_FORMATS:
+            raise ValueError(f"Unknown export format '{name}' - expected {', '.join(EXPORT_FORMATS)}")
+        if name not in formats:
+            formats.append(name)
+    if not formats:
+        raise ValueError("No export formats given")
+    return formats
+
+
+def export_base(path):
+    """Strip a known export extension so 'out.txt' and 'out' share one base name"""
+    for suffix in ('.manifest.json',) + tuple('.' + name for name in EXPORT_FORMATS):
+        if path.lower().endswith(suffix):
+            return path[:-len(suffix)]
+    return path
+
+
+class _AtomicFile:
+    """Binary temp file beside the target, hashed as it is written and renamed on commit"""
+
+    def __init__(self, path):
+        self.path = path
+        fd, self.tmp_path = create_temp(path, prefix='.export_')
+        self.file = os.fdopen(fd, 'wb')
+        self.sha256 = hashlib.sha256()
+        self.bytes = 0
+
+    def write(self, data):
+        self.sha256.update(data)
+        self.bytes += len(data)
+        self.file.write(data)
+
+    def finish(self):
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.file.close()
+
+    def commit(self):
+        publish_file(self.tmp_path, self.path)
+
+    def discard(self):
+        if not self.file.closed:
+            self.file.close()
+        if os.path.exists(self.tmp_path):
+            os.unlink(self.tmp_path)
+
+
+class _TextWriter:
+    """Report layout: target banner, then category headings with numbered queries"""
+
+    format = 'txt'
+
+    def __init__(self, path, header=None):
+        self.out = _AtomicFile(path)
+        self.buffer = io.StringIO()
+        self.records = 0
+        self._domain = None
+        self._category = None
+        self._number = 0
+        if header:
+            self.buffer.write(header.rstrip("\n") + "\n\n")
+
+    def write(self, domain, category, query):
+        if domain != self._domain:
+            if self._domain is not None:
+                self.buffer.write("\n")
+            self.buffer.write(f"{'=' * 80}\nTARGET: {domain}\n{'=' * 80}\n")
+            self._domain, self._category = domain, None
+        if category != self._category:
+            self.buffer.write(f"\n◆ {category.upper()}\n{'-' * (len(category) + 2)}\n")
+            self._category, self._number = category, 0
+        self._number += 1
+        self.buffer.write(f"{self._number:2d}. {query}\n")
+        self.records += 1
+        if self.buffer.tell() >= CHUNK_BYTES:
+            self.flush()
+
+    def flush(self):
+        self.out.write(self.buffer.getvalue().encode('utf-8'))
+        self.buffer = io.StringIO()
+
+    def finish(self):
+        self.flush()
+        self.out.finish()
+
+
+class _CsvWriter(_TextWriter):
+    """Tracker layout: one row per query, handed to the csv module in batches"""
+
+    format = 'csv'
+
+    def __init__(self, path):
+        self.out = _AtomicFile(path)
+        self.buffer = io.StringIO()
+        self.records = 0
+        self.rows = [('domain', 'category', 'number', 'query')]
+        self._numbers = {}
+        self._csv = csv.writer(self.buffer)
+
+    def write(self, domain, category, query):
+        number = self._numbers[(domain, category)] = self._numbers.get((domain, category), 0) + 1
+        self.rows.append((domain, category, number, query))
+        self.records += 1
+        if len(self.rows) >= CHUNK_ROWS:
+            self.flush()
+
+    def flush(self):
+        self._csv.writerows(self.rows)
+        self.rows = []
+        self.out.write(self.buffer.getvalue().encode('utf-8'))
+        self.buffer.seek(0)
+        self.buffer.truncate()
+
+
+class _GzipJsonlWriter:
+    """Pipeline layout: one JSON object per line, gzip compressed on worker threads
+
+    Each chunk is compressed independently into its own gzip member. A file
+    of concatenated members is valid gzip (gzip -d, zcat and Python's gzip
+    module read it as one stream). This lets chunks compress in parallel
+    while they are still written in order. At most `max_pending` chunks
+    are in flight, which bounds memory.
+    """
+
+    format = 'jsonl.gz'
+
+    def __init__(self, path, executor, compresslevel=6, max_pending=4):
+        self.out = _AtomicFile(path)
+        self.executor = executor
+        self.compresslevel = compresslevel
+        self.max_pending = max_pending
+        self.pending = deque()
+        self.lines = []
+        self.size = 0
+        self.records = 0
+        self._key = None
+        self._prefix = ""
+
+    def write(self, domain, category, query):
+        if (domain, category) != self._key:
+            # Same output as json.dumps of the whole record, but only the query is encoded per line
+            self._key = (domain, category)
+            self._prefix = json.dumps({'domain': domain, 'category': category}, ensure_ascii=False)[:-1] + ', "query": '
+        line = self._prefix + encode_basestring(query) + "}\n"
+        self.lines.append(line)
+        self.size += len(line)
+        self.records += 1
+        if self.size >= CHUNK_BYTES:
+            self.flush()
+
+    def flush(self):
+        if self.lines:
+            data = "".join(self.lines).encode('utf-8')
+            self.lines, self.size = [], 0
+            self.pending.append(self.executor.submit(gzip_member, data, self.compresslevel))
+        while len(self.pending) > self.max_pending:
+            self.out.write(self.pending.popleft().result())
+
+    def finish(self):
+        self.flush()
+        if not self.out.bytes and not self.pending:
+            # Keep an empty export a valid gzip file
+            self.pending.append(self.executor.submit(gzip_member, b"", self.compresslevel))
+        while self.pending:
+            self.out.write(self.pending.popleft().result())
+        self.out.finish()
+
+
+class TeeExporter:
+    """Write one pass over the queries to several formats at once
+
+    Usage:
+        with TeeExporter('reports/acme') as exporter:
+            for domain, category, query in queries:
+                exporter.write(domain, category, query)
+        # reports/acme.txt, acme.csv, acme.jsonl.gz, acme.manifest.json
+
+    Missing parent directories of the base path are created. Nothing is
+    visible under the final names until every writer finished.
+    The manifest is renamed into place last, so its presence means the
+    export is complete. If the block raises, all temp files are removed.
+    """
+
+    def __init__(self, base_path, formats=EXPORT_FORMATS, header=None, compress_workers=2, compresslevel=6):
+        self.base = export_base(base_path)
+        self.manifest_path = f"{self.base}.manifest.json"
+        self.writers = []
+        self.executor = None
+        self.manifest = None
+        os.makedirs(os.path.dirname(os.path.abspath(self.base)), exist_ok=True)
+        try:
+            for name in formats:
+                path = f"{self.base}.{name}"
+                if name == 'txt':
+                    self.writers.append(_TextWriter(path, header))
+                elif name == 'csv':
+                    self.writers.append(_CsvWriter(path))
+                elif name == 'jsonl.gz':
+                    if self.executor is None:
+                        self.executor = ThreadPoolExecutor(max_workers=compress_workers,
+                                                           thread_name_prefix='export-gzip')
+                    self.writers.append(_GzipJsonlWriter(path, self.executor, compresslevel,
+                                                         max_pending=compress_workers * 2))
+                else:
+                    raise ValueError(f"Unknown export format '{name}'")
+        except Exception:
+            self.abort()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.abort()
+        return False
+
+    def write(self, domain, category, query):
+        for writer in self.writers:
+            writer.write(domain, category, query)
+
+    def write_all(self, records):
+        """Consume (domain, category, query) records; returns how many were written"""
+        count = 0
+        for domain, category, query in records:
+            self.write(domain, category, query)
+            count += 1
+        return count
+
+    def commit(self):
+        """
+        Finish every writer, rename the files into place and write the manifest
+
+        Returns:
+            dict: The manifest (files with format, size, record count and sha256)
+        """
+        try:
+            for writer in self.writers:
+                writer.finish()
+            for writer in self.writers:
+                writer.out.commit()
+        except Exception:
+            self.abort()
+            raise
+        finally:
+            if self.executor is not None:
+                self.executor.shutdown(wait=True)
+
+        self.manifest = {
+            'version': 1,
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'records': self.writers[0].records if self.writers else 0,
+            'files': [{
+                'name': os.path.basename(writer.out.path),
+                'format': writer.format,
+                'bytes': writer.out.bytes,
+                'sha256': writer.out.sha256.hexdigest(),
+            } for writer in self.writers],
+        }
+        write_json_atomic(self.manifest_path, self.manifest)
+        return self.manifest
+
+    def abort(self):
+        """Drop every temp file without touching existing exports"""
+        for writer in self.writers:
+            for future in getattr(writer, 'pending', ()):
+                future.cancel()
+            writer.out.discard()
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+
+    @property
+    def paths(self):
+        return [writer.out.path for writer in self.writers] + [self.manifest_path]
+
+
+def verify_manifest(manifest_path):
+    """
+    Re-hash the files listed in a manifest
+
+    Returns:
+        list: Names of missing files or files whose checksum does not match
+    """
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    directory = os.path.dirname(os.path.abspath(manifest_path))
+    bad = []
+    for entry in manifest.get('files', []):
+        path = os.path.join(directory, entry['name'])
+        digest = hashlib.sha256()
+        try:
+            with open(path, 'rb') as f:
+                for block in iter(lambda: f.read(CHUNK_BYTES), b""):
+                    digest.update(block)
+        except OSError:
+            bad.append(entry['name'])
+            continue
+        if digest.hexdigest() != entry['sha256']:
+            bad.append(entry['name'])
+    return bad
@@ -0,0 +1,190 @@
+"""
+Budget-Aware Query Scheduler
+Spends a daily search budget on the highest-value (domain, query) pairs
+first and carries unused work over to the next day
+"""
+
+import hashlib
+import heapq
+import json
+import os
+from datetime import date
+
+from atomic_io import PRIVATE_FILE_MODE, write_json_atomic
+from dork_templates import DEFAULT_PRUNE_RULES, expand_template
+from google_dorks import GOOGLE_DORKS, TEMPLATE_PARAMETERS, get_template_priority
+
+
+def work_key(domain, query):
+    """Stable short key identifying a (domain, query) pair"""
+    return hashlib.sha1(f"{domain}\t{query}".encode('utf-8')).hexdigest()[:16]
+
+
+class QueryScheduler:
+    """Pick the top-k queries across many targets under a daily budget
+
+    Pending work lives in a heap ordered by priority (template weight times
+    target weight), then by position within its target, so equally valuable
+    work is interleaved across targets instead of draining one domain
+    before the next. Each day `plan_day` pops at most the remaining budget.
+    Planned queries that are never recorded as spent go back on the heap at
+    the next planning run, so nothing is lost when a day ends early.
+    """
+
+    def __init__(self, daily_budget, state_file=None):
+        if daily_budget <= 0:
+            raise ValueError("Daily budget must be a positive number of queries")
+        self.daily_budget = daily_budget
+        self.state_file = state_file
+        self.pending = []       # Heap of [-priority, ordinal, seq, domain, category, query]
+        self.in_flight = {}     # work key -> [day, entry]
+        self.spend = {}         # ISO day -> queries spent
+        self.done = set()       # Work keys already spent
+        self._seq = 0
+        if state_file and os.path.exists(state_file):
+            self.load()
+
+    def _known_keys(self):
+        keys = set(self.done)
+        keys.update(self.in_flight)
+        keys.update(work_key(entry[3], entry[5]) for entry in self.pending)
+        return keys
+
+    def add_targets(self, domains, categories=None, values=None, rules=DEFAULT_PRUNE_RULES,
+                    target_weights=None, allowed=None):
+        """
+        Queue every query for the given targets
+
+        Args:
+            domains (list): Cleaned target domains
+            categories (list): Categories to include (all when None)
+            values (dict): Placeholder values (TEMPLATE_PARAMETERS when None)
+            rules (tuple): Prune rules applied during template expansion
+            target_weights (dict): Optional domain -> multiplier on priority
+            allowed (set): Restrict to these templates (all when None)
+
+        Returns:
+            int: Number of newly queued queries (already known work is skipped)
+        """
+        categories = categories or list(GOOGLE_DORKS.keys())
+        values = TEMPLATE_PARAMETERS if values is None else values
+        target_weights = target_weights or {}
+        known = self._known_keys()
+        added = 0
+
+        for domain in domains:
+            weight = target_weights.get(domain, 1)
+            ordinal = 0
+            for category in categories:
+                for template in GOOGLE_DORKS.get(category, ()):
+                    if allowed is not None and template not in allowed:
+                        continue
+                    priority = get_template_priority(category, template) * weight
+                    for query in expand_template(template, values, rules, domain=domain):
+                        key = work_key(domain, query)
+                        if key in known:
+                            continue
+                        known.add(key)
+                        self.pending.append([-priority, ordinal, self._seq, domain, category, query])
+                        self._seq += 1
+                        ordinal += 1
+                        added += 1
+
+        heapq.heapify(self.pending)  # O(n) - cheaper than pushing one by one
+        return added
+
+    def remaining_budget(self, day=None):
+        """Queries still affordable on `day` (today when None)"""
+        day = (day or date.today()).isoformat()
+        return max(0, self.daily_budget - self.spend.get(day, 0))
+
+    def plan_day(self, day=None):
+        """
+        Pop the highest-value work that fits in the remaining budget
+
+        Work planned on an earlier day but never spent is carried over
+        first, so it competes on priority again instead of being dropped.
+
+        Returns:
+            list: (domain, category, query) tuples, highest priority first
+        """
+        day = day or date.today()
+        today = day.isoformat()
+
+        for key, (planned_day, entry) in list(self.in_flight.items()):
+            if planned_day != today:
+                del self.in_flight[key]
+                heapq.heappush(self.pending, entry)
+
+        slots = self.remaining_budget(day) - sum(
+            1 for planned_day, _entry in self.in_flight.values() if planned_day == today)
+        plan = []
+        while self.pending and slots > 0:
+            entry = heapq.heappop(self.pending)
+            self.in_flight[work_key(entry[3], entry[5])] = [today, entry]
+            plan.append((entry[3], entry[4], entry[5]))
+            slots -= 1
+        return plan
+
+    def record_spend(self, items, day=None):
+        """
+        Mark planned queries as executed and charge them to the budget
+
+        Args:
+            items (list): (domain, category, query) tuples from plan_day
+
+        Returns:
+            int: Number of queries charged
+        """
+        today = (day or date.today()).isoformat()
+        charged = 0
+        for domain, _category, query in items:
+            key = work_key(domain, query)
+            if self.in_flight.pop(key, None) is None:
+                continue
+            self.done.add(key)
+            charged += 1
+        self.spend[today] = self.spend.get(today, 0) + charged
+        return charged
+
+    def release(self, items):
+        """Return planned but unexecuted queries to the queue immediately"""
+        for domain, _category, query in items:
+            held = self.in_flight.pop(work_key(domain, query), None)
+            if held is not None:
+                heapq.heappush(self.pending, held[1])
+
+    def summary(self):
+        """Counts describing the campaign progress"""
+        return {
+            'pending': len(self.pending),
+            'in_flight': len(self.in_flight),
+            'done': len(self.done),
+            'daily_budget': self.daily_budget,
+            'spend': dict(self.spend),
+        }
+
+    def load(self):
+        """Load scheduler state from the state file"""
+        with open(self.state_file, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+        self.pending = [list(entry) for entry in state.get('pending', [])]
+        heapq.heapify(self.pending)
+        self.in_flight = {key: [held[0], list(held[1])] for key, held in state.get('in_flight', {}).items()}
+        self.spend = dict(state.get('spend', {}))
+        self.done = set(state.get('done', []))
+        self._seq = state.get('seq', len(self.pending))
+
+    def save(self):
+        """Atomically write scheduler state to the state file"""
+        if not self.state_file:
+            return
+        state = {
+            'daily_budget': self.daily_budget,
+            'seq': self._seq,
+            'spend': self.spend,
+            'done': sorted(self.done),
+            'in_flight': self.in_flight,
+            'pending': self.pending,
+        }
+        write_json_atomic(self.state_file, state, PRIVATE_FILE_MODE, indent=None)
@@ -0,0 +1,399 @@
+"""
+RECON-OPS Headless Generator
+Generates Google dork queries without the GUI for scripts and pipelines
+
+Usage:
+    python recon_headless.py -d example.com -d example.org -o queries.txt
+    python recon_headless.py --domains-file targets.txt -c "Database Files"
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+from dork_templates import (DEFAULT_PRUNE_RULES, estimate_catalog_count, exclude_values,
+                            merge_param_values, parse_param_spec)
+from google_dorks import GOOGLE_DORKS, TEMPLATE_PARAMETERS, clean_domain, iter_category_queries
+from query_export import EXPORT_FORMATS, TeeExporter, parse_formats
+
+
+def load_domains(domains=None, domains_file=None):
+    """
+    Collect and clean target domains from arguments and an optional file
+
+    Args:
+        domains (list): Domains given on the command line
+        domains_file (str): File with one domain per line ('#' starts a comment)
+
+    Returns:
+        list: Unique cleaned domains in input order
+    """
+    raw = list(domains or [])
+    if domains_file:
+        with open(domains_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.split('#', 1)[0].strip()
+                if line:
+                    raw.append(line)
+
+    seen = set()
+    cleaned = []
+    for domain in raw:
+        domain = clean_domain(domain)
+        if domain and domain not in seen:
+            seen.add(domain)
+            cleaned.append(domain)
+    return cleaned
+
+
+def iter_queries(domains, categories=None, values=None, rules=DEFAULT_PRUNE_RULES, allowed=None):
+    """
+    Stream generated queries for every domain and category
+
+    Args:
+        domains (list): Cleaned target domains
+        categories (list): Categories to include (all when None)
+        values (dict): Placeholder values (TEMPLATE_PARAMETERS when None)
+        rules (tuple): Prune rules applied during template expansion
+        allowed (set): Restrict to these templates (all when None)
+
+    Yields:
+        tuple: (domain, category, query)
+    """
+    categories = categories or list(GOOGLE_DORKS.keys())
+    for domain in domains:
+        for category in categories:
+            for query in iter_category_queries(domain, category, values, rules, allowed):
+                yield domain, category, query
+
+
+def resolve_template_options(args):
+    """
+    Build placeholder values and prune rules from --param/--exclude
+
+    Returns:
+        tuple: (values, rules)
+    """
+    overrides = parse_param_spec(';'.join(args.param))
+    values = merge_param_values(TEMPLATE_PARAMETERS, overrides)
+    rules = list(DEFAULT_PRUNE_RULES)
+    for field, blocked in parse_param_spec(';'.join(args.exclude)).items():
+        rules.append(exclude_values(field, blocked))
+    return values, tuple(rules)
+
+
+def filter_catalog(expression, categories=None):
+    """
+    Select templates with a columnar catalog filter
+
+    Returns:
+        tuple: (filtered catalog dict, set of allowed templates)
+    """
+    from dork_catalog import ColumnarCatalog, parse_filter
+
+    table = ColumnarCatalog()
+    mask = parse_filter(table, expression)
+    if categories:
+        mask &= table.category_mask(*categories)
+    catalog = {}
+    for category, template in table.select(mask):
+        catalog.setdefault(category, []).append(template)
+    allowed = {template for templates in catalog.values() for template in templates}
+    return catalog, allowed
+
+
+def build_parser():
+    """Create the headless command line parser"""
+    parser = argparse.ArgumentParser(description="RECON-OPS headless Google dork query generator")
+    parser.add_argument('-d', '--domain', action='append', default=[],
+                        help="Target domain (repeatable)")
+    parser.add_argument('--domains-file', help="File with one target domain per line")
+    parser.add_argument('-c', '--category', action='append', default=[],
+                        help="Intelligence category to include (repeatable, default: all)")
+    parser.add_argument('-p', '--param', action='append', default=[], metavar='NAME=V1,V2',
+                        help="Values for a template placeholder such as keyword=vpn,payroll (repeatable)")
+    parser.add_argument('--exclude', action='append', default=[], metavar='NAME=V1,V2',
+                        help="Prune expansions where a placeholder takes one of these values (repeatable)")
+    parser.add_argument('--where', metavar='EXPR',
+                        help="Filter templates by metadata, e.g. \"filetype=sql,env terms<20 risk>=high\"")
+    parser.add_argument('--estimate', action='store_true',
+                        help="Print the estimated query count and exit without generating")
+    parser.add_argument('-o', '--output', help="Output file (default: stdout)")
+    parser.add_argument('--export', metavar='BASE',
+                        help="Write BASE.txt, BASE.csv and BASE.jsonl.gz in one pass, plus BASE.manifest.json")
+    parser.add_argument('--formats', default=','.join(EXPORT_FORMATS), metavar='LIST',
+                        help=f"Formats written by --export (default: {','.join(EXPORT_FORMATS)})")
+    parser.add_argument('--budget', type=int, metavar='N',
+                        help="Daily search budget - emit only today's highest-value N queries")
+    parser.add_argument('--schedule-state', default='recon_ops_schedule.json', metavar='FILE',
+                        help="Scheduler state carried between days (default: recon_ops_schedule.json)")
+    parser.add_argument('--shard-dir', metavar='DIR',
+                        help="Shared work-queue directory for a campaign split across machines")
+    parser.add_argument('--shard-action', choices=('init', 'work', 'status', 'merge'), default='work',
+                        help="init: partition targets into shards; work: claim and generate shards; "
+                             "status: show progress; merge: combine results into --output")
+    parser.add_argument('--shards', type=int, default=16, metavar='N',
+                        help="Number of shards when initializing a campaign (default: 16)")
+    parser.add_argument('--node-id', help="Name of this node in the work queue (default: host-pid)")
+    parser.add_argument('--recurring', nargs='?', const='recon_ops_campaign.json', metavar='STATE',
+                        help="Recurring campaign: export only the delta since the run recorded in STATE "
+                             "(default: recon_ops_campaign.json); requires --export")
+    parser.add_argument('--every', metavar='INTERVAL',
+                        help="Recurring run interval such as 6h or 1d; runs that are not yet due exit quietly")
+    parser.add_argument('--loop', action='store_true',
+                        help="Keep running recurring campaigns every --every, re-reading targets and the catalog")
+    parser.add_argument('--dispatch', metavar='CMD',
+                        help="Shell command run on each delta export ({manifest} and {delta} are substituted)")
+    parser.add_argument('--profile', nargs='?', const='profiles', metavar='DIR',
+                        help="Profile the run and write reports to DIR (default: ./profiles)")
+    parser.add_argument('--profile-frames', type=int, default=1, metavar='N',
+                        help="Stack frames recorded per allocation while profiling (default: 1; "
+                             "deeper traces slow the run, 0 disables allocation tracing)")
+    return parser
+
+
+def run(args):
+    """Generate queries for parsed arguments and return an exit code"""
+    domains = load_domains(args.domain, args.domains_file)
+    if args.shard_dir and args.shard_action != 'init':
+        return run_shard_action(args)
+    if not domains and args.budget is None:
+        print("ERROR: Target domain required for intelligence operation.", file=sys.stderr)
+        return 2
+
+    unknown = [cat for cat in args.category if cat not in GOOGLE_DORKS]
+    if unknown:
+        print(f"ERROR: Unknown categories: {', '.join(unknown)}", file=sys.stderr)
+        return 2
+
+    try:
+        values, rules = resolve_template_options(args)
+    except ValueError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 2
+
+    # Filter first - every mode below honours --where
+    catalog, allowed = GOOGLE_DORKS, None
+    if args.where:
+        try:
+            catalog, allowed = filter_catalog(args.where, args.category)
+        except ValueError as e:
+            print(f"ERROR: {e}", file=sys.stderr)
+            return 2
+
+    if args.recurring:
+        return run_recurring(args)
+    if args.budget is not None:
+        return run_budgeted(args, domains, values, rules, allowed)
+    if args.shard_dir:
+        return run_shard_init(args, domains, values, allowed)
+
+    estimate = estimate_catalog_count(catalog, values, args.category or None, len(domains))
+    if args.estimate:
+        print(estimate)
+        return 0
+    print(f"⚡ ESTIMATED {estimate} QUERIES (BEFORE PRUNING)", file=sys.stderr)
+
+    if args.export:
+        return run_export(args, domains, values, rules, allowed)
+
+    out = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    total = 0
+    try:
+        for _domain, _category, query in iter_queries(domains, args.category, values, rules, allowed):
+            out.write(query + "\n")
+            total += 1
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    print(f"⚡ {total} TACTICAL QUERIES GENERATED | {len(domains)} TARGETS", file=sys.stderr)
+    return 0
+
+
+def run_export(args, domains, values, rules, allowed):
+    """Generate once and tee the queries into every requested export format"""
+    try:
+        formats = parse_formats(args.formats)
+    except ValueError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 2
+
+    # -o still receives the plain query list alongside the export files
+    out = open(args.output, 'w', encoding='utf-8') if args.output else None
+    try:
+        with TeeExporter(args.export, formats) as exporter:
+            for domain, category, query in iter_queries(domains, args.category, values, rules, allowed):
+                exporter.write(domain, category, query)
+                if out:
+                    out.write(query + "\n")
+    except OSError as e:
+        print(f"ERROR: Export failed: {e}", file=sys.stderr)
+        return 2
+    finally:
+        if out:
+            out.close()
+
+    print(f"⚡ {exporter.manifest['records']} TACTICAL QUERIES EXPORTED | {len(domains)} TARGETS | "
+          f"{', '.join(formats).upper()} | MANIFEST: {exporter.manifest_path}", file=sys.stderr)
+    return 0
+
+
+def run_budgeted(args, domains, values, rules, allowed=None):
+    """Queue targets in the scheduler and emit today's share of the budget"""
+    from query_scheduler import QueryScheduler
+
+    try:
+        scheduler = QueryScheduler(args.budget, args.schedule_state)
+    except ValueError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 2
+    added = scheduler.add_targets(domains, args.category or None, values, rules, allowed=allowed)
+    plan = scheduler.plan_day()
+
+    out = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    try:
+        for _domain, _category, query in plan:
+            out.write(query + "\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    # Headless output is handed straight to the analyst, so it counts as spent
+    scheduler.record_spend(plan)
+    scheduler.save()
+
+    summary = scheduler.summary()
+    print(f"⚡ {len(plan)} QUERIES SCHEDULED TODAY | {added} NEW | "
+          f"{summary['pending']} CARRIED OVER | {summary['done']} DONE", file=sys.stderr)
+    return 0
+
+
+def run_recurring(args):
+    """Run a recurring campaign once, or on every interval with --loop"""
+    from recurring_campaigns import RecurringCampaign, campaign_inputs, parse_interval
+
+    if not args.export:
+        print("ERROR: --recurring requires --export BASE for the delta files", file=sys.stderr)
+        return 2
+    try:
+        interval = parse_interval(args.every) if args.every else None
+        formats = parse_formats(args.formats)
+    except ValueError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 2
+    if args.loop and interval is None:
+        print("ERROR: --loop requires --every", file=sys.stderr)
+        return 2
+
+    campaign = RecurringCampaign(args.recurring)
+    watcher = None
+    if args.loop:
+        from catalog_watcher import CatalogWatcher
+        watcher = CatalogWatcher()
+
+    while True:
+        wait = campaign.seconds_until_due(interval) if interval else 0
+        if wait and not args.loop:
+            print(f"⚡ CAMPAIGN NOT DUE | NEXT RUN IN {int(wait)}s", file=sys.stderr)
+            return 0
+        if wait:
+            try:
+                time.sleep(wait)
+            except KeyboardInterrupt:
+                return 0
+            continue
+
+        if watcher is not None:
+            changes = watcher.poll()
+            if changes and 'error' in changes:
+                print(f"WARNING: Catalog reload failed, using last good catalog: {changes['error']}", file=sys.stderr)
+
+        # Targets and parameters are re-read every run - they are what changes between runs
+        domains = load_domains(args.domain, args.domains_file)
+        values, _rules = resolve_template_options(args)
+        # Re-filtered every run so templates added to the library are matched too
+        allowed = filter_catalog(args.where, args.category)[1] if args.where else None
+        inputs = campaign_inputs(domains, args.category or None, values,
+                                 parse_param_spec(';'.join(args.exclude)), allowed)
+        try:
+            record = campaign.run(inputs, args.export, formats, args.dispatch)
+        except (OSError, RuntimeError) as e:
+            print(f"ERROR: Recurring run failed: {e}", file=sys.stderr)
+            if not args.loop:
+                return 2
+            campaign.state['last_run'] = time.time()  # Back off one interval, state is not advanced
+        else:
+            print(f"⚡ DELTA RUN | {record['records']} QUERIES | +{record['added_domains']} "
+                  f"-{record['removed_domains']} TARGETS | +{record['added_templates']} "
+                  f"-{record['removed_templates']} ~{record['reexpanded_templates']} TEMPLATES"
+                  + (f" | MANIFEST: {record['manifest']}" if record['manifest'] else " | NO CHANGES"),
+                  file=sys.stderr)
+        if not args.loop:
+            return 0
+
+
+def run_shard_init(args, domains, values, allowed=None):
+    """Partition the campaign into shard manifests in the shared directory"""
+    from campaign_shards import init_campaign
+
+    try:
+        sizes = init_campaign(args.shard_dir, domains, args.shards, args.category or None,
+                              values, parse_param_spec(';'.join(args.exclude)), allowed)
+    except ValueError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 2
+    print(f"⚡ CAMPAIGN SHARDED | {sum(sizes)} WORK UNITS | {len(sizes)} SHARDS | "
+          f"{min(sizes)}-{max(sizes)} UNITS PER SHARD", file=sys.stderr)
+    return 0
+
+
+def run_shard_action(args):
+    """Work, report on or merge a sharded campaign"""
+    from campaign_shards import ShardWorker, campaign_status, merge_results
+
+    if not os.path.exists(os.path.join(args.shard_dir, 'campaign.json')):
+        print(f"ERROR: No campaign initialized in {args.shard_dir}", file=sys.stderr)
+        return 2
+
+    if args.shard_action == 'work':
+        worker = ShardWorker(args.shard_dir, args.node_id)
+        completed = worker.run()
+        total = sum(count for _shard, count in completed)
+        print(f"⚡ NODE {worker.node_id} | {len(completed)} SHARDS COMPLETED | {total} QUERIES",
+              file=sys.stderr)
+        return 0
+
+    if args.shard_action == 'status':
+        status = campaign_status(args.shard_dir)
+        print(json.dumps(status, indent=2))
+        return 0
+
+    if not args.output:
+        print("ERROR: --output is required to merge shard results", file=sys.stderr)
+        return 2
+    total, missing = merge_results(args.shard_dir, args.output)
+    print(f"⚡ {total} QUERIES MERGED | {len(missing)} SHARDS OUTSTANDING", file=sys.stderr)
+    return 1 if missing else 0
+
+
+def main(argv=None):
+    """Headless entry point"""
+    args = build_parser().parse_args(argv)
+
+    if not args.profile:
+        return run(args)
+
+    # Profiling is imported lazily so a normal run pays nothing for it
+    from recon_profiler import ProfileSession
+    with ProfileSession(args.profile, label="recon_headless", trace_frames=args.profile_frames) as session:
+        code = run(args)
+    for kind, path in session.report_paths.items():
+        print(f"PROFILE {kind.upper()}: {path}", file=sys.stderr)
+    return code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -16,6 +16,11 @@ import os
 import sys
 import webbrowser
 import urllib.parse
+import re
+import threading
+import time
+from collections import deque
+from itertools import islice
 try:
     from PIL import Image, ImageTk, ImageDraw, ImageFont
     PIL_AVAILABLE = True
@@ -24,7 +29,72 @@ except ImportError:
 import json
 
 # Import our dorks module
-from google_dorks import GOOGLE_DORKS, get_dork_count
+from google_dorks import (GOOGLE_DORKS, TEMPLATE_PARAMETERS, CATEGORY_PRIORITIES, DEFAULT_PRIORITY,
+                          get_dork_count, clean_domain, iter_category_queries)
+from dork_templates import estimate_expansion_count, merge_param_values, parse_param_spec
+from catalog_watcher import CatalogWatcher
+from dork_search import DorkSearchIndex
+from target_history import TargetHistory, HISTORY_FILE_NAME
+from query_export import TeeExporter
+from dork_catalog import KNOWN_OPERATORS
+
+# Ask before rendering expansions larger than this
+LARGE_EXPANSION_WARNING = 20000
+
+# How often dork source files are checked for edits (milliseconds)
+CATALOG_POLL_MS = 1000
+
+# Maximum templates listed under the search box
+SEARCH_RESULT_LIMIT = 200
+
+# How often a background search index build is checked for completion (milliseconds)
+SEARCH_INDEX_POLL_MS = 50
+
+# Quiet period before target history is written to disk (milliseconds)
+HISTORY_SAVE_DELAY_MS = 2000
+
+# Keys that never trigger domain autocomplete
+NO_COMPLETE_KEYS = ('BackSpace', 'Delete', 'Left', 'Right', 'Up', 'Down', 'Home', 'End', 'Return', 'Tab', 'Escape')
+
+# Query view rendering: lines shown before generate_queries returns, lines per
+# insert call, and how long one idle slice may keep the event loop (milliseconds)
+RENDER_FIRST_LINES = 150
+RENDER_BATCH_LINES = 200
+RENDER_SLICE_MS = 15
+
+# Operators with their own highlight colour - the others share 'dork_operator'
+HIGHLIGHTED_OPERATORS = ('site', 'filetype', 'inurl')
+_HIGHLIGHT_RE = re.compile(r'(?<![\w.])-?(' + '|'.join(KNOWN_OPERATORS) + r'):(?:"[^"]*"|[^\s()]*)|"[^"]*"')
+
+
+def tokenize_query(query):
+    """
+    Split a query into runs for syntax highlighting
+    
+    Args:
+        query (str): Generated dork query
+        
+    Returns:
+        list: (text, tag) pairs covering the whole query; tag is None for plain text
+    """
+    runs = []
+    position = 0
+    for match in _HIGHLIGHT_RE.finditer(query):
+        if match.start() > position:
+            runs.append((query[position:match.start()], None))
+        operator = match.group(1)
+        if operator is None:
+            tag = 'dork_quoted'
+        elif operator in HIGHLIGHTED_OPERATORS:
+            tag = f'dork_{operator}'
+        else:
+            tag = 'dork_operator'
+        runs.append((match.group(), tag))
+        position = match.end()
+    if position < len(query):
+        runs.append((query[position:], None))
+    return runs
+
 
 class ReconOpsApp:
     def __init__(self, root):
@@ -39,6 +109,10 @@ class ReconOpsApp:
         self.config_file = "recon_ops_settings.json"
         self.window_settings = self.load_window_settings()
         
+        # Target history lives alongside the settings file
+        self.target_history = TargetHistory(os.path.join(os.path.dirname(self.config_file), HISTORY_FILE_NAME))
+        self.history_save_job = None
+        
         # Calculate responsive window size with user preferences
         if self.window_settings.get('remember_size', True):
             window_width = self.window_settings.get('width', min(max(1000, int(screen_width * 0.75)), 1400))
@@ -85,14 +159,30 @@ class ReconOpsApp:
         
         # Application state
         self.target_domain = tk.StringVar()
+        self.template_params = tk.StringVar()
         self.generated_queries = {}
         self.category_vars = {}
         self.browser_offset = 0  # Track which queries have been opened
+        self.block_tags = {}  # Category -> text tag covering its block in queries_text
+        self.render_queue = deque()  # Line iterators still to be inserted into queries_text
+        self.render_job = None  # Pending after_idle slice
+        self.last_generation = None  # Domain, template values and plan of the current query set
+        self.search_index = None  # Built on a worker thread at startup and after each reload
+        self.search_index_build = None  # {'index'} slot filled by the running build
+        self.search_results = []  # (category, template) rows shown in the results list
+        self.pinned_templates = set()  # (category, template) picked from search results
         
         # Initialize UI
         self.setup_styles()
         self.create_widgets()
         
+        # Hot reload of the dork catalog
+        self.catalog_watcher = CatalogWatcher()
+        self.root.after(CATALOG_POLL_MS, self.poll_catalog)
+        
+        # Search index is built off the UI thread once the window is up
+        self.root.after_idle(self.rebuild_search_index)
+        
         # Focus on domain entry
         self.domain_entry.focus()
 
@@ -350,6 +440,9 @@ TACTICAL INTELLIGENCE GATHERING SYSTEM
                                      width=40)
         self.domain_entry.pack(side=tk.LEFT, padx=(0, 10), fill=tk.X, expand=True)
         self.domain_entry.bind('<Return>', self.generate_queries)
+        self.domain_entry.bind('<FocusIn>', lambda e: self.target_history.load_async())
+        self.domain_entry.bind('<KeyRelease>', self.on_domain_key)
+        self.domain_entry.bind('<Tab>', self.accept_domain_completion)
         
         self.generate_btn = ttk.Button(target_input_frame, 
                                      text="⚡ GENERATE",
@@ -357,6 +450,23 @@ TACTICAL INTELLIGENCE GATHERING SYSTEM
                                      style='Tactical.TButton')
         self.generate_btn.pack(side=tk.RIGHT)
         
+        # Template parameters for placeholders beyond {domain}
+        params_input_frame = ttk.Frame(target_frame, style='Military.TFrame')
+        params_input_frame.pack(fill=tk.X, pady=(8, 0))
+        
+        ttk.Label(params_input_frame, text="PARAMS:", style='Military.TLabel').pack(side=tk.LEFT, padx=(0, 10))
+        
+        self.params_entry = ttk.Entry(params_input_frame,
+                                     textvariable=self.template_params,
+                                     style='Military.TEntry',
+                                     width=40)
+        self.params_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        self.params_entry.bind('<Return>', self.generate_queries)
+        
+        ttk.Label(params_input_frame,
+                  text="e.g. keyword=vpn,payroll; year=2024",
+                  style='Subtitle.TLabel').pack(side=tk.LEFT, padx=(10, 0))
+        
         # Categories - COMPACT
         categories_frame = ttk.LabelFrame(controls_frame, text="[ CATEGORIES ]", padding="10")
         categories_frame.pack(fill=tk.X, pady=(0, 10))
@@ -384,6 +494,13 @@ TACTICAL INTELLIGENCE GATHERING SYSTEM
         )
         self.queries_text.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
         
+        # Dork syntax highlighting - applied as queries are rendered
+        self.queries_text.tag_configure('dork_site', foreground=self.colors['accent_amber'])
+        self.queries_text.tag_configure('dork_filetype', foreground='#00d7ff')
+        self.queries_text.tag_configure('dork_inurl', foreground='#ff6ec7')
+        self.queries_text.tag_configure('dork_operator', foreground='#7fb2ff')
+        self.queries_text.tag_configure('dork_quoted', foreground=self.colors['text_secondary'])
+        
         # BOTTOM SECTION - GUARANTEED VISIBLE BUTTONS
         bottom_frame = ttk.Frame(main_frame, style='Military.TFrame')
         bottom_frame.pack(fill=tk.X, side=tk.BOTTOM)
@@ -406,6 +523,9 @@ TACTICAL INTELLIGENCE GATHERING SYSTEM
         ttk.Button(btn_row1, text="💾 EXPORT",
                   command=self.export_queries, style='Command.TButton').pack(side=tk.LEFT, padx=(0, 10))
         
+        ttk.Button(btn_row1, text="📦 EXPORT ALL FORMATS",
+                  command=self.export_all_formats, style='Command.TButton').pack(side=tk.LEFT, padx=(0, 10))
+        
         ttk.Button(btn_row1, text="🌐 OPEN BROWSER",
                   command=self.open_queries_in_browser, style='Tactical.TButton').pack(side=tk.LEFT, padx=(0, 10))
         
@@ -438,9 +558,63 @@ TACTICAL INTELLIGENCE GATHERING SYSTEM
         ttk.Button(select_frame, text="✗ CLEAR ALL", 
                   command=self.clear_all_categories, style='Command.TButton').pack(side=tk.LEFT)
         
+        # Instant template search
+        ttk.Label(select_frame, text="SEARCH:", style='Military.TLabel').pack(side=tk.LEFT, padx=(30, 10))
+        self.search_var = tk.StringVar()
+        self.search_entry = ttk.Entry(select_frame,
+                                     textvariable=self.search_var,
+                                     style='Military.TEntry',
+                                     width=30)
+        self.search_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        self.search_var.trace_add('write', self.on_search_changed)
+        
+        self.pinned_var = tk.StringVar(value="0 TEMPLATES PINNED")
+        ttk.Label(select_frame, textvariable=self.pinned_var, style='Subtitle.TLabel').pack(side=tk.LEFT, padx=(10, 10))
+        ttk.Button(select_frame, text="✗ UNPIN",
+                  command=self.clear_pinned_templates, style='Command.TButton').pack(side=tk.LEFT)
+        
         # Category grid
-        categories_grid = ttk.Frame(parent, style='Military.TFrame')
-        categories_grid.pack(fill=tk.X)
+        self.categories_grid = ttk.Frame(parent, style='Military.TFrame')
+        self.categories_grid.pack(fill=tk.X)
+        self.populate_category_grid()
+        
+        # Search results - only shown while a search is active
+        self.search_results_frame = ttk.Frame(parent, style='Military.TFrame')
+        
+        self.search_count_var = tk.StringVar()
+        ttk.Label(self.search_results_frame, textvariable=self.search_count_var,
+                  style='Subtitle.TLabel').pack(anchor=tk.W)
+        
+        results_list_frame = ttk.Frame(self.search_results_frame, style='Military.TFrame')
+        results_list_frame.pack(fill=tk.X)
+        
+        self.search_listbox = tk.Listbox(results_list_frame,
+                                         height=8,
+                                         selectmode=tk.MULTIPLE,
+                                         exportselection=False,  # Keep pins when text is selected elsewhere
+                                         font=('Consolas', 9),
+                                         bg=self.colors['bg_secondary'],
+                                         fg=self.colors['text_secondary'],
+                                         selectbackground=self.colors['accent_green'],
+                                         selectforeground=self.colors['bg_primary'],
+                                         relief='solid',
+                                         borderwidth=1)
+        results_scrollbar = ttk.Scrollbar(results_list_frame, orient=tk.VERTICAL,
+                                          command=self.search_listbox.yview)
+        self.search_listbox.configure(yscrollcommand=results_scrollbar.set)
+        self.search_listbox.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        results_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.search_listbox.bind('<<ListboxSelect>>', self.on_search_selection)
+        
+    def populate_category_grid(self):
+        """(Re)build the category checkboxes, keeping existing selections"""
+        for child in self.categories_grid.winfo_children():
+            child.destroy()
+        
+        # Drop categories that no longer exist in the catalog
+        for category in list(self.category_vars):
+            if category not in GOOGLE_DORKS:
+                del self.category_vars[category]
         
         # Create checkboxes for each category
         row = 0
@@ -448,11 +622,13 @@ TACTICAL INTELLIGENCE GATHERING SYSTEM
         max_cols = 4
         
         for category in GOOGLE_DORKS.keys():
-            var = tk.BooleanVar(value=True)  # All selected by default
-            self.category_vars[category] = var
+            var = self.category_vars.get(category)
+            if var is None:
+                var = tk.BooleanVar(value=True)  # New categories selected by default
+                self.category_vars[category] = var
             
             # Create checkbox with military styling
-            cb = ttk.Checkbutton(categories_grid, 
+            cb = ttk.Checkbutton(self.categories_grid, 
                                text=f"⚡ {category}",
                                variable=var,
                                style='Military.TCheckbutton')
@@ -472,64 +648,372 @@ TACTICAL INTELLIGENCE GATHERING SYSTEM
             return
         
         # Clean domain
-        domain = domain.replace('http://', '').replace('https://', '').replace('www.', '').strip('/')
+        domain = clean_domain(domain)
         self.target_domain.set(domain)
         
-        # Get selected categories
-        selected_categories = [cat for cat, var in self.category_vars.items() if var.get()]
+        # Selected categories plus individually pinned templates
+        plan = self.build_generation_plan()
         
-        if not selected_categories:
-            messagebox.showerror("ERROR", "Select at least one intelligence category.")
+        if not plan:
+            messagebox.showerror("ERROR", "Select at least one intelligence category or pinned template.")
+            return
+        
+        # Placeholder values - typed fields override the defaults
+        try:
+            overrides = parse_param_spec(self.template_params.get())
+        except ValueError as e:
+            messagebox.showerror("ERROR", f"Invalid template parameters: {str(e)}")
+            return
+        template_values = merge_param_values(TEMPLATE_PARAMETERS, overrides)
+        
+        # Estimate up front so a runaway cartesian product never gets generated by accident
+        estimated = sum(estimate_expansion_count(template, template_values)
+                        for category, allowed in plan.items()
+                        for template in GOOGLE_DORKS[category]
+                        if allowed is None or template in allowed)
+        if estimated > LARGE_EXPANSION_WARNING and not messagebox.askyesno(
+                "LARGE OPERATION",
+                f"Template parameters expand to up to {estimated} queries.\n\nContinue?"):
             return
         
         # Generate queries
+        self.cancel_rendering()
         self.generated_queries = {}
+        self.block_tags = {}
         self.browser_offset = 0  # Reset browser batch tracking for new queries
+        self.last_generation = {'domain': domain, 'values': template_values, 'plan': plan}
         query_output = []
         
         query_output.append("="*80)
         query_output.append(f"TACTICAL INTELLIGENCE QUERIES FOR: {domain.upper()}")
         query_output.append(f"GENERATED: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        query_output.append(f"CATEGORIES: {len(selected_categories)} selected")
+        query_output.append(f"CATEGORIES: {len(plan)} selected")
         query_output.append("="*80)
         query_output.append("")
         
-        total_queries = 0
+        # Display in text area - each category block gets its own tag so
+        # a catalog reload can replace just that block
+        self.queries_text.delete(1.0, tk.END)
+        self.queries_text.insert(tk.END, "\n".join(query_output) + "\n")
         
-        for category in selected_categories:
-            if category in GOOGLE_DORKS:
-                category_queries = []
-                query_output.append(f"◆ {category.upper()}")
-                query_output.append("-" * (len(category) + 2))
-                
-                for i, dork in enumerate(GOOGLE_DORKS[category], 1):
-                    formatted_query = dork.format(domain=domain)
-                    category_queries.append(formatted_query)
-                    query_output.append(f"{i:2d}. {formatted_query}")
-                    total_queries += 1
-                
-                query_output.append("")
-                self.generated_queries[category] = category_queries
+        for category, allowed in plan.items():
+            category_queries = list(iter_category_queries(domain, category, template_values, allowed=allowed))
+            self.generated_queries[category] = category_queries
+            tag = f"block_{len(self.block_tags)}"
+            self.block_tags[category] = tag
+            self.render_queue.append(self.iter_block_lines(tag, category, category_queries))
         
-        query_output.append("="*80)
-        query_output.append(f"OPERATION SUMMARY:")
-        query_output.append(f"• Total Queries Generated: {total_queries}")
-        query_output.append(f"• Categories Covered: {len(selected_categories)}")
-        query_output.append(f"• Target Domain: {domain}")
-        query_output.append("")
-        query_output.append("INSTRUCTIONS:")
-        query_output.append("1. Copy individual queries or export all")
-        query_output.append("2. Execute manually in Google Search")
-        query_output.append("3. Analyze results for intelligence value")
-        query_output.append("4. Maintain operational security")
-        query_output.append("="*80)
+        total_queries = sum(len(queries) for queries in self.generated_queries.values())
+        self.render_queue.append(iter([[(self.format_summary(domain), ('summary',))]]))
         
-        # Display in text area
-        self.queries_text.delete(1.0, tk.END)
-        self.queries_text.insert(tk.END, "\n".join(query_output))
+        # First screen now, the rest in idle slices so the window keeps responding
+        self.render_pending(max_lines=RENDER_FIRST_LINES)
+        if self.render_queue:
+            self.render_job = self.root.after_idle(self.render_slice)
         
         # Update status
         self.status_var.set(f"⚡ QUERIES GENERATED | {total_queries} TACTICAL QUERIES | TARGET: {domain.upper()}")
+        
+        self.remember_target(domain, [category for category, var in self.category_vars.items() if var.get()])
+
+    def on_domain_key(self, event):
+        """Autocomplete the domain entry inline from target history"""
+        if event.keysym in NO_COMPLETE_KEYS or not event.char or not event.char.isprintable():
+            return
+        
+        # Only complete at the end of the entry; editing inside a target keeps the rest of it
+        typed = self.domain_entry.get()
+        if not typed or self.domain_entry.index(tk.INSERT) != len(typed):
+            return
+        matches = self.target_history.complete(typed, 1)
+        if not matches or len(matches[0]) <= len(typed):
+            return
+        
+        # Keep what was typed and select the suggested remainder
+        self.domain_entry.delete(0, tk.END)
+        self.domain_entry.insert(0, typed + matches[0][len(typed):])
+        self.domain_entry.select_range(len(typed), tk.END)
+        self.domain_entry.icursor(len(typed))
+
+    def accept_domain_completion(self, event=None):
+        """Accept the suggested target and restore its last category selection"""
+        if not self.domain_entry.selection_present():
+            return None
+        self.domain_entry.selection_clear()
+        self.domain_entry.icursor(tk.END)
+        
+        categories = self.target_history.categories_for(self.domain_entry.get())
+        if categories:
+            for category, var in self.category_vars.items():
+                var.set(category in categories)
+        return 'break'
+
+    def remember_target(self, domain, categories):
+        """Record a target in history and schedule a debounced save"""
+        try:
+            self.target_history.record(domain, categories)
+        except Exception:
+            return  # History is a convenience - never interrupt an operation
+        
+        if self.history_save_job is not None:
+            self.root.after_cancel(self.history_save_job)
+        self.history_save_job = self.root.after(HISTORY_SAVE_DELAY_MS, self.flush_target_history)
+
+    def flush_target_history(self, wait=False):
+        """Write pending target history to disk
+
+        Args:
+            wait (bool): Save even if the history is still loading (on exit).
+                Otherwise the save is pushed back until loading finished,
+                so the UI thread never blocks on the history file.
+        """
+        self.history_save_job = None
+        if not wait and self.target_history.loading:
+            self.history_save_job = self.root.after(HISTORY_SAVE_DELAY_MS, self.flush_target_history)
+            return
+        try:
+            self.target_history.save()
+        except Exception:
+            pass  # Silently fail - don't interrupt user experience
+
+    def build_generation_plan(self):
+        """
+        Work out what to generate, in catalog order
+        
+        Returns:
+            dict: Category mapped to None (all templates) or the set of pinned templates
+        """
+        pinned = {}
+        for category, template in self.pinned_templates:
+            pinned.setdefault(category, set()).add(template)
+        
+        plan = {}
+        for category in GOOGLE_DORKS:
+            var = self.category_vars.get(category)
+            if var is not None and var.get():
+                plan[category] = None
+            elif category in pinned:
+                plan[category] = pinned[category]
+        return plan
+
+    def on_search_changed(self, *args):
+        """Refresh search results on every keystroke"""
+        query = self.search_var.get()
+        if not query.strip():
+            self.search_results = []
+            self.search_results_frame.pack_forget()
+            return
+        
+        if self.search_index is None:
+            # Still building - check_search_index re-runs the search when it is ready
+            self.search_results = []
+            self.search_listbox.delete(0, tk.END)
+            self.search_count_var.set("INDEXING CATALOG… RESULTS WILL APPEAR SHORTLY")
+            if not self.search_results_frame.winfo_ismapped():
+                self.search_results_frame.pack(fill=tk.X, pady=(10, 0))
+            return
+        total, self.search_results = self.search_index.search(query, SEARCH_RESULT_LIMIT)
+        
+        # One delete and one insert call keeps the update within a frame
+        self.search_listbox.delete(0, tk.END)
+        if self.search_results:
+            self.search_listbox.insert(tk.END, *[f"[{category}] {template}"
+                                                 for category, template in self.search_results])
+            for index, row in enumerate(self.search_results):
+                if row in self.pinned_templates:
+                    self.search_listbox.selection_set(index)
+        
+        shown = len(self.search_results)
+        more = f" (SHOWING TOP {shown})" if total > shown else ""
+        self.search_count_var.set(f"{total} MATCHING TEMPLATES{more} | CLICK TO PIN FOR GENERATION")
+        if not self.search_results_frame.winfo_ismapped():
+            self.search_results_frame.pack(fill=tk.X, pady=(10, 0))
+
+    def rebuild_search_index(self):
+        """Start building the search index for the current catalog on a worker thread"""
+        self.search_index = None
+        build = {'index': None}
+        self.search_index_build = build
+        snapshot = {category: list(templates) for category, templates in GOOGLE_DORKS.items()}
+        
+        def worker():
+            try:
+                build['index'] = DorkSearchIndex(snapshot)
+            except Exception:
+                build['index'] = DorkSearchIndex({})  # Never leave the search box waiting forever
+        
+        threading.Thread(target=worker, daemon=True).start()
+        self.root.after(SEARCH_INDEX_POLL_MS, self.check_search_index, build)
+
+    def check_search_index(self, build):
+        """Install a finished index on the UI thread (superseded builds are dropped)"""
+        if build is not self.search_index_build:
+            return
+        if build['index'] is None:
+            self.root.after(SEARCH_INDEX_POLL_MS, self.check_search_index, build)
+            return
+        self.search_index = build['index']
+        self.search_index_build = None
+        if self.search_var.get().strip():
+            self.on_search_changed()
+
+    def on_search_selection(self, event=None):
+        """Pin or unpin templates clicked in the search results"""
+        selected = set(self.search_listbox.curselection())
+        for index, row in enumerate(self.search_results):
+            if index in selected:
+                self.pinned_templates.add(row)
+            else:
+                self.pinned_templates.discard(row)
+        self.pinned_var.set(f"{len(self.pinned_templates)} TEMPLATES PINNED")
+
+    def clear_pinned_templates(self):
+        """Unpin every template picked from search results"""
+        self.pinned_templates.clear()
+        self.search_listbox.selection_clear(0, tk.END)
+        self.pinned_var.set("0 TEMPLATES PINNED")
+
+    def iter_block_lines(self, tag, category, queries):
+        """Yield one category block line by line as pre-tokenized (text, tags) runs"""
+        plain = (tag,)
+        yield [(f"◆ {category.upper()}\n{'-' * (len(category) + 2)}\n", plain)]
+        for i, query in enumerate(queries, 1):
+            runs = [(f"{i:2d}. ", plain)]
+            runs.extend((text, (tag, highlight) if highlight else plain) for text, highlight in tokenize_query(query))
+            runs.append(("\n", plain))
+            yield runs
+        yield [("\n", plain)]
+
+    def insert_runs(self, index, lines):
+        """Insert pre-tokenized lines with one Text.insert call, merging runs that share tags"""
+        args = []
+        parts = []
+        current = None
+        for runs in lines:
+            for text, tags in runs:
+                if tags != current and parts:
+                    args.extend(("".join(parts), current))
+                    parts = []
+                current = tags
+                parts.append(text)
+        if parts:
+            args.extend(("".join(parts), current))
+        if args:
+            self.queries_text.insert(index, *args)
+
+    def render_pending(self, max_lines=None, deadline=None):
+        """Insert queued lines in batches until max_lines or the deadline is reached"""
+        rendered = 0
+        while self.render_queue and (max_lines is None or rendered < max_lines):
+            size = RENDER_BATCH_LINES if max_lines is None else min(RENDER_BATCH_LINES, max_lines - rendered)
+            batch = list(islice(self.render_queue[0], size))
+            if len(batch) < size:
+                self.render_queue.popleft()
+            if batch:
+                self.insert_runs(tk.END, batch)
+                rendered += len(batch)
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+
+    def render_slice(self):
+        """Render for one time slice, then yield to the event loop until it is idle again"""
+        self.render_job = None
+        self.render_pending(deadline=time.perf_counter() + RENDER_SLICE_MS / 1000)
+        if self.render_queue:
+            self.render_job = self.root.after_idle(self.render_slice)
+
+    def cancel_rendering(self):
+        """Drop queued lines (the query view is about to be replaced)"""
+        if self.render_job:
+            self.root.after_cancel(self.render_job)
+            self.render_job = None
+        self.render_queue.clear()
+
+    def finish_rendering(self):
+        """Render everything still queued, for operations that need the complete view"""
+        if self.render_job:
+            self.root.after_cancel(self.render_job)
+            self.render_job = None
+        self.render_pending()
+
+    def format_summary(self, domain):
+        """Render the operation summary that closes the query view"""
+        total_queries = sum(len(queries) for queries in self.generated_queries.values())
+        summary = [
+            "="*80,
+            "OPERATION SUMMARY:",
+            f"• Total Queries Generated: {total_queries}",
+            f"• Categories Covered: {len(self.generated_queries)}",
+            f"• Target Domain: {domain}",
+            "",
+            "INSTRUCTIONS:",
+            "1. Copy individual queries or export all",
+            "2. Execute manually in Google Search",
+            "3. Analyze results for intelligence value",
+            "4. Maintain operational security",
+            "="*80,
+        ]
+        return "\n".join(summary)
+
+    def poll_catalog(self):
+        """Hot-reload the dork catalog when its source files change"""
+        try:
+            changes = self.catalog_watcher.poll()
+            if changes and 'error' in changes:
+                self.status_var.set(f"⚠ CATALOG RELOAD SKIPPED | {changes['error']} | KEEPING LAST GOOD CATALOG")
+            elif changes:
+                self.apply_catalog_changes(changes)
+        except Exception as e:
+            self.status_var.set(f"⚠ CATALOG RELOAD FAILED | {str(e)}")
+        finally:
+            self.root.after(CATALOG_POLL_MS, self.poll_catalog)
+
+    def apply_catalog_changes(self, changes):
+        """Update the category grid and refresh only the affected query blocks"""
+        if changes['added'] or changes['removed'] or list(self.category_vars) != list(GOOGLE_DORKS):
+            self.populate_category_grid()
+        
+        # Search index and pins follow the new catalog
+        self.rebuild_search_index()
+        self.pinned_templates = {(category, template) for category, template in self.pinned_templates
+                                 if template in GOOGLE_DORKS.get(category, ())}
+        self.pinned_var.set(f"{len(self.pinned_templates)} TEMPLATES PINNED")
+        self.on_search_changed()
+        
+        refreshed = 0
+        if self.generated_queries and self.last_generation:
+            self.finish_rendering()  # Block ranges must exist before they are replaced
+            domain = self.last_generation['domain']
+            values = self.last_generation['values']
+            plan = self.last_generation['plan']
+            
+            for category in changes['removed']:
+                if category in self.block_tags:
+                    start, end = self.queries_text.tag_ranges(self.block_tags.pop(category))
+                    self.queries_text.delete(start, end)
+                    self.generated_queries.pop(category, None)
+                    refreshed += 1
+            
+            for category in changes['changed']:
+                if category not in self.block_tags:
+                    continue
+                tag = self.block_tags[category]
+                queries = list(iter_category_queries(domain, category, values, allowed=plan.get(category)))
+                self.generated_queries[category] = queries
+                start, end = self.queries_text.tag_ranges(tag)
+                self.queries_text.delete(start, end)
+                self.insert_runs(start, self.iter_block_lines(tag, category, queries))
+                refreshed += 1
+            
+            if refreshed:
+                start, end = self.queries_text.tag_ranges('summary')
+                self.queries_text.delete(start, end)
+                self.queries_text.insert(start, self.format_summary(domain), 'summary')
+                self.browser_offset = 0  # Query list changed under the browser batches
+        
+        changed = len(changes['added']) + len(changes['removed']) + len(changes['changed'])
+        self.status_var.set(f"♻ CATALOG RELOADED | {get_dork_count()} QUERIES LOADED | "
+                            f"{changed} CATEGORIES CHANGED | {refreshed} BLOCKS REFRESHED")
 
     def copy_all_queries(self):
         """Copy all generated queries to clipboard"""
@@ -539,6 +1023,7 @@ TACTICAL INTELLIGENCE GATHERING SYSTEM
         
         try:
             # Get all text from the text widget
+            self.finish_rendering()
             all_text = self.queries_text.get(1.0, tk.END)
             pyperclip.copy(all_text)
             messagebox.showinfo("SUCCESS", "All tactical queries copied to clipboard!")
@@ -563,6 +1048,7 @@ TACTICAL INTELLIGENCE GATHERING SYSTEM
         
         if filename:
             try:
+                self.finish_rendering()
                 with open(filename, 'w', encoding='utf-8') as f:
                     all_text = self.queries_text.get(1.0, tk.END)
                     f.write(all_text)
@@ -570,10 +1056,41 @@ TACTICAL INTELLIGENCE GATHERING SYSTEM
             except Exception as e:
                 messagebox.showerror("ERROR", f"Failed to export queries: {str(e)}")
 
+    def export_all_formats(self):
+        """Export queries as TXT, CSV and JSONL.gz in one pass with a checksum manifest"""
+        if not self.generated_queries:
+            messagebox.showwarning("WARNING", "No queries generated. Execute intelligence generation first.")
+            return
+        
+        domain = self.target_domain.get().strip()
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        
+        filename = filedialog.asksaveasfilename(
+            title="Export base name (.txt, .csv, .jsonl.gz and .manifest.json are written)",
+            filetypes=[("All files", "*.*")],
+            initialfile=f"RECON_OPS_{domain}_{timestamp}"
+        )
+        
+        if filename:
+            ranked = sorted(self.generated_queries.items(),
+                            key=lambda item: -CATEGORY_PRIORITIES.get(item[0], DEFAULT_PRIORITY))
+            header = f"TACTICAL INTELLIGENCE QUERIES FOR: {domain.upper()}\nGENERATED: {timestamp}"
+            try:
+                with TeeExporter(filename, header=header) as exporter:
+                    for category, queries in ranked:
+                        for query in queries:
+                            exporter.write(domain, category, query)
+                files = "\n".join(os.path.basename(path) for path in exporter.paths)
+                messagebox.showinfo("SUCCESS", f"{exporter.manifest['records']} tactical queries exported to:\n{files}")
+            except Exception as e:
+                messagebox.showerror("ERROR", f"Failed to export queries: {str(e)}")
+
     def get_all_queries_flat(self):
-        """Get all queries as a flat list for batch processing"""
+        """Get all queries as a flat list for batch processing, highest-value categories first"""
         all_queries = []
-        for category, queries in self.generated_queries.items():
+        ranked = sorted(self.generated_queries.items(),
+                        key=lambda item: -CATEGORY_PRIORITIES.get(item[0], DEFAULT_PRIORITY))
+        for category, queries in ranked:
             all_queries.extend(queries)
         return all_queries
 
@@ -683,8 +1200,10 @@ TACTICAL INTELLIGENCE GATHERING SYSTEM
     def clear_queries(self):
         """Clear all generated queries"""
         if messagebox.askyesno("CONFIRM", "Clear all generated intelligence queries?"):
+            self.cancel_rendering()
             self.queries_text.delete(1.0, tk.END)
             self.generated_queries = {}
+            self.block_tags = {}
             self.browser_offset = 0  # Reset browser batch tracking
             self.status_var.set(f"⚡ SYSTEM READY | {get_dork_count()} TACTICAL QUERIES LOADED | AWAITING TARGET")
 
@@ -742,11 +1261,27 @@ TACTICAL INTELLIGENCE GATHERING SYSTEM
         if self.window_settings.get('remember_size', True):
             self.save_window_settings()
         
+        # Flush any debounced target history write
+        if self.history_save_job is not None:
+            self.root.after_cancel(self.history_save_job)
+        self.flush_target_history(wait=True)
+        
         # Close the application
         self.root.destroy()
 
-def main():
-    """Launch RECON-OPS application"""
+def parse_args(argv=None):
+    """Parse RECON-OPS launch options"""
+    import argparse
+    parser = argparse.ArgumentParser(description="RECON-OPS v2.0 - Tactical Intelligence Platform")
+    parser.add_argument('--profile', nargs='?', const='profiles', metavar='DIR',
+                        help="Profile the session and write reports to DIR at exit (default: ./profiles)")
+    parser.add_argument('--profile-frames', type=int, default=1, metavar='N',
+                        help="Stack frames recorded per allocation while profiling (default: 1; "
+                             "deeper traces slow the run, 0 disables allocation tracing)")
+    return parser.parse_args(argv)
+
+def run_app():
+    """Create the main window and run the event loop"""
     root = tk.Tk()
     app = ReconOpsApp(root)
     
@@ -765,5 +1300,20 @@ def main():
     
     root.mainloop()
 
+def main(argv=None):
+    """Launch RECON-OPS application"""
+    args = parse_args(argv)
+    
+    if not args.profile:
+        run_app()
+        return
+    
+    # Profiling is imported lazily so a normal launch pays nothing for it
+    from recon_profiler import ProfileSession
+    with ProfileSession(args.profile, label="recon_ops", trace_frames=args.profile_frames) as session:
+        run_app()
+    for kind, path in session.report_paths.items():
+        print(f"PROFILE {kind.upper()}: {path}")
+
 if __name__ == "__main__":
     main()
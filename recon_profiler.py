@@ -0,0 +1,189 @@
+"""
+Session Profiling Module
+Wraps a RECON-OPS session in cProfile and tracemalloc and writes
+a pstats file, a top allocations report and a collapsed-stack file at exit
+
+tracemalloc hooks every allocation, which slows allocation-heavy code and
+skews the CPU profile towards it. It therefore records 1 frame by default;
+deeper traces are opt-in and 0 turns allocation tracing off entirely.
+"""
+
+import cProfile
+import os
+import pstats
+import tracemalloc
+from datetime import datetime
+
+# Flame graph recursion guards - keeps huge call graphs bounded
+MAX_STACK_DEPTH = 64
+MIN_SAMPLE_US = 1
+DEFAULT_TRACE_FRAMES = 1
+
+
+class ProfileSession:
+    """Profile a block of work with cProfile and tracemalloc
+
+    Usage:
+        with ProfileSession("profiles", label="recon_ops") as session:
+            run_campaign()
+        print(session.report_paths)
+    """
+
+    def __init__(self, output_dir, label="recon_ops", top_allocations=25, trace_frames=DEFAULT_TRACE_FRAMES):
+        self.output_dir = output_dir
+        self.label = label
+        self.top_allocations = top_allocations
+        self.trace_frames = trace_frames
+        self.profiler = None
+        self.report_paths = {}
+        self._started_tracemalloc = False
+
+    def start(self):
+        """Start CPU and memory profiling"""
+        if self.trace_frames > 0 and not tracemalloc.is_tracing():
+            tracemalloc.start(self.trace_frames)
+            self._started_tracemalloc = True
+        self.profiler = cProfile.Profile()
+        self.profiler.enable()
+
+    def stop(self):
+        """Stop profiling and write all reports
+
+        Returns:
+            dict: Report kind mapped to the written file path
+        """
+        if self.profiler is None:
+            return self.report_paths
+
+        self.profiler.disable()
+        snapshot = None
+        if tracemalloc.is_tracing():
+            snapshot = tracemalloc.take_snapshot()
+            current, peak = tracemalloc.get_traced_memory()
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+        os.makedirs(self.output_dir, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        base = os.path.join(self.output_dir, f"{self.label}_{timestamp}")
+
+        stats_path = f"{base}.pstats"
+        self.profiler.dump_stats(stats_path)
+        stats = pstats.Stats(stats_path)
+
+        collapsed_path = f"{base}.collapsed"
+        write_collapsed_stacks(stats, collapsed_path)
+
+        self.profiler = None
+        self.report_paths = {
+            'pstats': stats_path,
+            'collapsed': collapsed_path,
+        }
+        if snapshot is not None:
+            alloc_path = f"{base}_allocations.txt"
+            write_allocation_report(snapshot, alloc_path, self.top_allocations, current, peak)
+            self.report_paths['allocations'] = alloc_path
+        return self.report_paths
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+        return False
+
+
+def write_allocation_report(snapshot, path, limit=25, current=0, peak=0):
+    """
+    Write the top memory allocation sites of a tracemalloc snapshot
+
+    Args:
+        snapshot (tracemalloc.Snapshot): Snapshot taken at the end of the session
+        path (str): Report file to write
+        limit (int): Number of allocation sites to list
+        current (int): Traced memory in bytes when the snapshot was taken
+        peak (int): Peak traced memory in bytes
+    """
+    snapshot = snapshot.filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    ))
+    top_stats = snapshot.statistics('lineno')
+
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(f"TRACED MEMORY: current={current / 1024:.1f} KiB peak={peak / 1024:.1f} KiB\n")
+        f.write(f"NOTE: CPU times in the .pstats and .collapsed files were recorded under allocation\n"
+                f"tracing ({tracemalloc.get_traceback_limit()} frame(s)), which inflates allocation-heavy functions.\n"
+                f"Profile again with --profile-frames 0 for undistorted CPU times.\n\n")
+        f.write(f"TOP {limit} ALLOCATION SITES\n")
+        f.write("=" * 80 + "\n")
+        for index, stat in enumerate(top_stats[:limit], 1):
+            frame = stat.traceback[0]
+            f.write(f"{index:3d}. {frame.filename}:{frame.lineno} "
+                    f"size={stat.size / 1024:.1f} KiB count={stat.count}\n")
+        other = top_stats[limit:]
+        if other:
+            other_size = sum(stat.size for stat in other)
+            f.write(f"     {len(other)} other sites: {other_size / 1024:.1f} KiB\n")
+
+
+def _frame_name(func):
+    """Render a pstats function key as a flame graph frame"""
+    filename, lineno, name = func
+    if filename == '~':
+        label = name  # Built-in functions
+    else:
+        label = f"{name} ({os.path.basename(filename)}:{lineno})"
+    return label.replace(';', ':')
+
+
+def write_collapsed_stacks(stats, path):
+    """
+    Write cProfile data as collapsed stacks for flamegraph.pl / speedscope
+
+    cProfile only records caller/callee edges, so each function's own time
+    is spread across its call paths in proportion to the cumulative time of
+    every incoming edge. Values are microseconds.
+
+    Args:
+        stats (pstats.Stats): Loaded profile statistics
+        path (str): Collapsed-stack file to write
+    """
+    raw = stats.stats
+    callees = {}
+    for func, (_cc, _nc, _tt, _ct, callers) in raw.items():
+        for caller, edge in callers.items():
+            callees.setdefault(caller, []).append((func, edge[3]))
+
+    roots = [func for func, entry in raw.items() if not entry[4]]
+    samples = {}
+
+    def walk(func, stack, fraction):
+        _cc, _nc, tt, ct, _callers = raw[func]
+        stack = stack + (_frame_name(func),)
+        own = int(tt * fraction * 1_000_000)
+        if own >= MIN_SAMPLE_US:
+            key = ';'.join(stack)
+            samples[key] = samples.get(key, 0) + own
+        if len(stack) >= MAX_STACK_DEPTH or ct <= 0:
+            return
+        for callee, edge_ct in callees.get(func, ()):
+            if callee == func or _frame_name(callee) in stack:
+                continue  # Recursion - time is already attributed on this path
+            callee_ct = raw[callee][3]
+            if callee_ct <= 0:
+                continue
+            child_fraction = fraction * min(1.0, edge_ct / callee_ct)
+            if raw[callee][3] * child_fraction * 1_000_000 < MIN_SAMPLE_US:
+                continue
+            walk(callee, stack, child_fraction)
+
+    for root in roots:
+        walk(root, (), 1.0)
+
+    with open(path, 'w', encoding='utf-8') as f:
+        for stack, value in sorted(samples.items()):
+            f.write(f"{stack} {value}\n")
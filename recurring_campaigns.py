@@ -0,0 +1,283 @@
+"""
+Recurring Campaign Module
+Re-runs a campaign on a fixed interval and generates, exports and dispatches
+only what changed since the last run. Added targets get every template.
+Targets already covered get only new templates and the new expansions of
+templates whose placeholder values changed.
+"""
+
+import json
+import os
+import re
+import shlex
+import subprocess
+import time
+from datetime import datetime
+
+from atomic_io import write_json_atomic
+from dork_templates import DEFAULT_PRUNE_RULES, exclude_values, expand_template, template_fields
+from google_dorks import GOOGLE_DORKS
+from query_export import EXPORT_FORMATS, TeeExporter
+
+DEFAULT_STATE_FILE = "recon_ops_campaign.json"
+HISTORY_LIMIT = 50
+
+_INTERVAL_RE = re.compile(r'^\s*(\d+(?:\.\d+)?)\s*([smhdw]?)\s*$', re.IGNORECASE)
+_INTERVAL_UNITS = {'': 1, 's': 1, 'm': 60, 'h': 3600, 'd': 86400, 'w': 604800}
+
+
+def parse_interval(text):
+    """
+    Parse a run interval such as "90s", "30m", "6h", "1d" or "2w"
+
+    Returns:
+        float: Interval in seconds
+
+    Raises:
+        ValueError: Malformed or non-positive interval
+    """
+    match = _INTERVAL_RE.match(str(text))
+    if not match:
+        raise ValueError(f"Invalid interval '{text}' - expected e.g. 30m, 6h, 1d")
+    seconds = float(match.group(1)) * _INTERVAL_UNITS[match.group(2).lower()]
+    if seconds <= 0:
+        raise ValueError("Interval must be positive")
+    return seconds
+
+
+def prune_rules(exclude):
+    """Prune rules for an exclude spec ({field: [values]})"""
+    rules = list(DEFAULT_PRUNE_RULES)
+    for field, blocked in exclude.items():
+        rules.append(exclude_values(field, blocked))
+    return tuple(rules)
+
+
+def campaign_inputs(domains, categories=None, values=None, exclude=None, allowed=None):
+    """
+    Snapshot everything that determines a campaign's queries
+
+    The selected part of the catalog is copied, so the next run can tell
+    which templates are new even after the library was edited. With
+    `allowed` (a --where filter) only those templates are part of the run.
+    """
+    categories = categories or list(GOOGLE_DORKS.keys())
+    return {
+        'domains': sorted(set(domains)),
+        'catalog': {category: [template for template in GOOGLE_DORKS[category]
+                               if allowed is None or template in allowed]
+                    for category in categories if category in GOOGLE_DORKS},
+        'values': {field: list(options) for field, options in (values or {}).items()},
+        'exclude': {field: sorted(blocked) for field, blocked in (exclude or {}).items()},
+    }
+
+
+def changed_fields(previous, current):
+    """Placeholder fields whose values or exclusions differ between two snapshots"""
+    fields = set()
+    for key in ('values', 'exclude'):
+        old, new = previous.get(key, {}), current.get(key, {})
+        fields.update(field for field in set(old) | set(new) if old.get(field) != new.get(field))
+    return fields
+
+
+def plan_delta(previous, current):
+    """
+    Work out what a run has to generate
+
+    A template whose text was edited shows up as one removed and one added
+    template.
+
+    Args:
+        previous (dict or None): Inputs of the last completed run
+        current (dict): Inputs of this run
+
+    Returns:
+        dict: added_domains, removed_domains, kept_domains, added_templates,
+        removed_templates and reexpanded_templates (category -> templates
+        whose placeholder values changed)
+    """
+    if not previous:
+        return {'added_domains': list(current['domains']), 'removed_domains': [], 'kept_domains': [],
+                'added_templates': {}, 'removed_templates': {}, 'reexpanded_templates': {}}
+
+    old_domains, new_domains = set(previous['domains']), set(current['domains'])
+    fields = changed_fields(previous, current)
+    added, removed, reexpanded = {}, {}, {}
+    for category in set(previous['catalog']) | set(current['catalog']):
+        old = previous['catalog'].get(category, [])
+        new = current['catalog'].get(category, [])
+        old_set, new_set = set(old), set(new)
+        if new_set - old_set:
+            added[category] = [template for template in new if template not in old_set]
+        if old_set - new_set:
+            removed[category] = [template for template in old if template not in new_set]
+        if fields:
+            touched = [template for template in new if template in old_set and fields.intersection(template_fields(template))]
+            if touched:
+                reexpanded[category] = touched
+
+    return {
+        'added_domains': sorted(new_domains - old_domains),
+        'removed_domains': sorted(old_domains - new_domains),
+        'kept_domains': sorted(new_domains & old_domains),
+        'added_templates': added,
+        'removed_templates': removed,
+        'reexpanded_templates': reexpanded,
+    }
+
+
+def delta_is_empty(delta):
+    return not any(delta[key] for key in ('added_domains', 'removed_domains', 'added_templates',
+                                          'removed_templates', 'reexpanded_templates'))
+
+
+def iter_delta_queries(previous, current, delta):
+    """
+    Stream only the queries this run adds
+
+    Yields:
+        tuple: (domain, category, query)
+    """
+    values, rules = current['values'], prune_rules(current['exclude'])
+    for domain in delta['added_domains']:
+        for category, templates in current['catalog'].items():
+            for template in templates:
+                for query in expand_template(template, values, rules, domain=domain):
+                    yield domain, category, query
+
+    if not delta['kept_domains']:
+        return
+    old_values, old_rules = previous['values'], prune_rules(previous['exclude'])
+    for domain in delta['kept_domains']:
+        for category, templates in delta['added_templates'].items():
+            for template in templates:
+                for query in expand_template(template, values, rules, domain=domain):
+                    yield domain, category, query
+        for category, templates in delta['reexpanded_templates'].items():
+            for template in templates:
+                seen = set(expand_template(template, old_values, old_rules, domain=domain))
+                for query in expand_template(template, values, rules, domain=domain):
+                    if query not in seen:
+                        yield domain, category, query
+
+
+def quote_for_shell(path):
+    """Quote a path for the platform shell (cmd.exe does not understand POSIX single quotes)"""
+    if os.name == 'nt':
+        return subprocess.list2cmdline([path])
+    return shlex.quote(path)
+
+
+def dispatch(command, manifest_path, delta_path):
+    """
+    Hand a finished delta export to a downstream command
+
+    `{manifest}` and `{delta}` in the command are replaced with the paths,
+    quoted for the platform shell. Both are also passed as
+    RECON_OPS_MANIFEST / RECON_OPS_DELTA.
+
+    Returns:
+        int: The command's exit code
+    """
+    env = dict(os.environ, RECON_OPS_MANIFEST=manifest_path, RECON_OPS_DELTA=delta_path)
+    command = (command.replace('{manifest}', quote_for_shell(manifest_path))
+               .replace('{delta}', quote_for_shell(delta_path)))
+    return subprocess.run(command, shell=True, env=env).returncode
+
+
+class RecurringCampaign:
+    """A campaign re-run on an interval, remembering the inputs of its last run
+
+    State is only advanced after the delta was exported and dispatched. If
+    a run fails, the next run therefore produces the same delta again.
+    """
+
+    def __init__(self, state_path=DEFAULT_STATE_FILE):
+        self.state_path = state_path
+        self.state = self.load()
+
+    def load(self):
+        try:
+            if os.path.exists(self.state_path):
+                with open(self.state_path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+        except Exception:
+            pass
+        return {'version': 1, 'inputs': None, 'last_run': None, 'runs': []}
+
+    def save(self):
+        write_json_atomic(self.state_path, self.state)
+
+    def seconds_until_due(self, interval, now=None):
+        """Seconds until the next run is due (0 when due now)"""
+        last = self.state.get('last_run')
+        if last is None:
+            return 0
+        now = time.time() if now is None else now
+        return max(0.0, last + interval - now)
+
+    def unique_base(self, export_base, now):
+        """
+        Export base for a run: the prefix plus a microsecond timestamp
+
+        A counter is appended while an export with that name already
+        exists, so two runs never overwrite each other's delta.
+        """
+        stamped = f"{export_base}_{datetime.fromtimestamp(now).strftime('%Y%m%d_%H%M%S_%f')}"
+        base, counter = stamped, 1
+        while any(os.path.exists(f"{base}.{suffix}") for suffix in ('manifest.json', 'delta.json') + tuple(EXPORT_FORMATS)):
+            counter += 1
+            base = f"{stamped}_{counter}"
+        return base
+
+    def run(self, inputs, export_base, formats=EXPORT_FORMATS, dispatch_command=None, now=None):
+        """
+        Generate, export and dispatch the delta against the last run
+
+        Args:
+            inputs (dict): Snapshot from campaign_inputs()
+            export_base (str): Export path prefix; a unique timestamp is appended per run
+            formats (list): Export formats
+            dispatch_command (str): Shell command run on the finished export
+            now (float): Run time (defaults to time.time())
+
+        Returns:
+            dict: Run record (delta counts, records, manifest path)
+
+        Raises:
+            RuntimeError: The dispatch command failed (state is not advanced)
+        """
+        now = time.time() if now is None else now
+        previous = self.state.get('inputs')
+        delta = plan_delta(previous, inputs)
+        record = {
+            'at': datetime.fromtimestamp(now).isoformat(timespec='seconds'),
+            'added_domains': len(delta['added_domains']),
+            'removed_domains': len(delta['removed_domains']),
+            'added_templates': sum(len(t) for t in delta['added_templates'].values()),
+            'removed_templates': sum(len(t) for t in delta['removed_templates'].values()),
+            'reexpanded_templates': sum(len(t) for t in delta['reexpanded_templates'].values()),
+            'records': 0,
+            'manifest': None,
+        }
+
+        if not delta_is_empty(delta):
+            base = self.unique_base(export_base, now)
+            with TeeExporter(base, formats) as exporter:
+                exporter.write_all(iter_delta_queries(previous, inputs, delta))
+            delta_path = f"{exporter.base}.delta.json"
+            write_json_atomic(delta_path, dict(delta, records=exporter.manifest['records']))
+            record['records'] = exporter.manifest['records']
+            record['manifest'] = exporter.manifest_path
+
+            if dispatch_command:
+                code = dispatch(dispatch_command, exporter.manifest_path, delta_path)
+                if code != 0:
+                    raise RuntimeError(f"Dispatch command exited with {code}; delta will be retried next run")
+
+        self.state['inputs'] = inputs
+        self.state['last_run'] = now
+        self.state['runs'] = (self.state.get('runs', []) + [record])[-HISTORY_LIMIT:]
+        self.save()
+        return record
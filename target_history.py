@@ -0,0 +1,226 @@
+"""
+Target History Module
+Persisted history of targets and their category selections, with
+prefix-trie autocomplete for the domain entry
+"""
+
+import json
+import os
+import threading
+import time
+
+from atomic_io import PRIVATE_FILE_MODE, write_json_atomic
+
+HISTORY_FILE_NAME = "recon_ops_history.json"
+TOP_COMPLETIONS = 8
+
+
+class _TrieNode:
+    __slots__ = ('label', 'children', 'top')
+
+    def __init__(self, label=""):
+        self.label = label      # Edge label leading to this node
+        self.children = {}      # First character of child label -> node
+        self.top = []           # Best (score, key) pairs below this node, best first
+
+
+class PrefixTrie:
+    """Path-compressed trie that keeps the top completions at every node
+
+    Edges hold whole substrings, so the node count stays below twice the
+    number of keys even for tens of thousands of targets. Every node
+    caches its TOP_COMPLETIONS best keys. A lookup is therefore one walk
+    down the prefix, with no subtree search, however large the history
+    grows. Scores may only increase, which keeps the cached lists exact.
+    """
+
+    def __init__(self, top=TOP_COMPLETIONS):
+        self.root = _TrieNode()
+        self.top_size = top
+
+    def _offer(self, node, score, key, fresh):
+        top = node.top
+        if fresh:
+            # Bulk load in best-first order: a full list can never improve
+            if len(top) < self.top_size:
+                top.append((score, key))
+            return
+        for index, (_old_score, old_key) in enumerate(top):
+            if old_key == key:
+                del top[index]
+                break
+        if len(top) >= self.top_size and score <= top[-1][0]:
+            return
+        position = len(top)
+        while position and top[position - 1][0] < score:
+            position -= 1
+        top.insert(position, (score, key))
+        del top[self.top_size:]
+
+    def insert(self, key, score, fresh=False):
+        """
+        Add a key or raise its score
+
+        Args:
+            key (str): Key to insert
+            score: Comparable score (higher completes first)
+            fresh (bool): Key is new and keys arrive best first (bulk load)
+        """
+        node = self.root
+        self._offer(node, score, key, fresh)
+        i = 0
+        while i < len(key):
+            child = node.children.get(key[i])
+            if child is None:
+                child = _TrieNode(key[i:])
+                node.children[key[i]] = child
+                self._offer(child, score, key, fresh)
+                return
+            label = child.label
+            common = 0
+            limit = min(len(label), len(key) - i)
+            while common < limit and label[common] == key[i + common]:
+                common += 1
+            if common < len(label):
+                # Split the edge so the shared part becomes its own node
+                middle = _TrieNode(label[:common])
+                middle.top = list(child.top)
+                child.label = label[common:]
+                middle.children[child.label[0]] = child
+                node.children[key[i]] = middle
+                child = middle
+            i += common
+            node = child
+            self._offer(node, score, key, fresh)
+
+    def complete(self, prefix, limit=TOP_COMPLETIONS):
+        """Best keys starting with prefix, highest score first"""
+        node = self.root
+        i = 0
+        while i < len(prefix):
+            child = node.children.get(prefix[i])
+            if child is None:
+                return []
+            rest = prefix[i:]
+            if rest.startswith(child.label):
+                i += len(child.label)
+            elif child.label.startswith(rest):
+                i = len(prefix)
+            else:
+                return []
+            node = child
+        return [key for _score, key in node.top[:limit]]
+
+
+class TargetHistory:
+    """Persisted target history with lazy trie loading and atomic saves
+
+    The history file is read on a background thread the first time
+    completions are needed, so opening the app never waits on it. Until
+    loading finishes, complete() simply returns nothing and record()
+    queues its entry for the loader to apply.
+    """
+
+    def __init__(self, path=HISTORY_FILE_NAME):
+        self.path = path
+        self.targets = {}       # domain -> {'count', 'last_used', 'categories'}
+        self.trie = None
+        self.dirty = False
+        self._lock = threading.Lock()
+        self._loader = None
+        self._queued = []               # Records made before the history was loaded
+        self._queue_lock = threading.Lock()
+
+    @staticmethod
+    def _score(entry):
+        return (entry.get('count', 0), entry.get('last_used', 0))
+
+    @property
+    def loading(self):
+        """True while records are queued behind an unfinished load"""
+        return self.trie is None and bool(self._queued)
+
+    def _apply(self, targets, trie, domain, categories, used):
+        entry = targets.setdefault(domain, {'count': 0})
+        entry['count'] = entry.get('count', 0) + 1
+        entry['last_used'] = used
+        entry['categories'] = categories
+        trie.insert(domain, self._score(entry))
+
+    def load_async(self):
+        """Start loading the history in the background (once)"""
+        if self.trie is None and self._loader is None:
+            self._loader = threading.Thread(target=self.ensure_loaded, daemon=True)
+            self._loader.start()
+
+    def ensure_loaded(self):
+        """Load the history file and build the trie if not done yet"""
+        with self._lock:
+            if self.trie is not None:
+                return
+            targets = {}
+            try:
+                if os.path.exists(self.path):
+                    with open(self.path, 'r', encoding='utf-8') as f:
+                        targets = json.load(f).get('targets', {})
+            except Exception:
+                targets = {}  # Corrupt history - start fresh rather than block the user
+
+            trie = PrefixTrie()
+            # Best first, so each node's top list fills without reshuffling
+            for domain, entry in sorted(targets.items(), key=lambda item: self._score(item[1]), reverse=True):
+                trie.insert(domain, self._score(entry), fresh=True)
+            with self._queue_lock:
+                for record in self._queued:
+                    self._apply(targets, trie, *record)
+                    self.dirty = True
+                self._queued = []
+                self.targets = targets
+                self.trie = trie
+
+    def complete(self, prefix, limit=TOP_COMPLETIONS):
+        """Completions for a typed prefix (empty until the history is loaded)"""
+        if self.trie is None:
+            self.load_async()
+            return []
+        return self.trie.complete(prefix.lower(), limit)
+
+    def categories_for(self, domain):
+        """Category selection last used with a target"""
+        entry = self.targets.get(domain.lower())
+        return list(entry.get('categories', [])) if entry else []
+
+    def record(self, domain, categories):
+        """
+        Remember a generated target and its category selection
+
+        Never waits for the history file: before it is loaded the record is
+        queued and applied by the background loader.
+        """
+        record = (domain.lower(), list(categories), time.time())
+        with self._queue_lock:
+            if self.trie is None:
+                self._queued.append(record)
+                queued = True
+            else:
+                queued = False
+        if queued:
+            self.load_async()
+            return
+        with self._lock:
+            self._apply(self.targets, self.trie, *record)
+            self.dirty = True
+
+    def save(self):
+        """Atomically write the history file if it changed
+
+        Queued records are loaded first, which blocks until the history
+        file has been read.
+        """
+        if self._queued:
+            self.ensure_loaded()
+        if not self.dirty:
+            return
+        with self._lock:
+            write_json_atomic(self.path, {'version': 1, 'targets': self.targets}, PRIVATE_FILE_MODE, indent=None)
+            self.dirty = False